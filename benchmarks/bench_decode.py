@@ -0,0 +1,72 @@
+"""Per-image CPU time and peak memory of the full-resolution decode vs the draft/reduce decode path.
+
+Usage: python benchmarks/bench_decode.py [image files or URLs...]
+
+Without arguments a few synthetic multi-megapixel JPEGs are generated. Each
+variant runs in a fresh process so its peak RSS can be read back (POSIX only).
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from services.image_pipeline import MAX_SIZE, fetch_image_bytes, decode_image, decode_fitted, fit_size
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def full_decode(data):
+    image = decode_image(data)
+    return image.resize(fit_size(image.width, image.height, MAX_SIZE), Image.LANCZOS)
+
+
+def reduced_decode(data):
+    return decode_fitted(data, max_size=MAX_SIZE)
+
+
+VARIANTS = {"full decode + LANCZOS": full_decode, "draft + reduce + LANCZOS": reduced_decode}
+
+
+def run_variant(name, sources, queue):
+    blobs = [fetch_image_bytes(source) for source in sources]
+    blobs = [blob for blob in blobs if blob]
+    start = time.process_time()
+    for blob in blobs:
+        VARIANTS[name](blob)
+    per_image = (time.process_time() - start) / max(1, len(blobs))
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    queue.put((per_image, peak_kb))
+
+
+def synthetic_sources(directory, count=4):
+    sources = []
+    for i in range(count):
+        path = os.path.join(directory, f"synthetic_{i}.jpg")
+        Image.effect_noise((4000, 3000), 64 + i * 16).convert("RGB").save(path, quality=90)
+        sources.append(path)
+    return sources
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        sources = sys.argv[1:] or synthetic_sources(directory)
+        print(f"{len(sources)} images, target {MAX_SIZE}px")
+        for name in VARIANTS:
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=run_variant, args=(name, sources, queue))
+            process.start()
+            per_image, peak_kb = queue.get()
+            process.join()
+            memory = f"{peak_kb / 1024:7.1f} MB peak RSS" if peak_kb else "peak RSS n/a"
+            print(f"{name:26s} {per_image * 1000:8.1f} ms/image  {memory}")
+
+
+if __name__ == "__main__":
+    main()
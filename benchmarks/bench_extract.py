@@ -0,0 +1,67 @@
+"""Micro-benchmark for story extraction over the articles in the article store (news_cache.db).
+
+Usage: python benchmarks/bench_extract.py [rounds]
+
+Article pages are downloaded once into memory, then every extractor backend
+is timed against the original full-document html.parser walk.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from services.extractor import ArticleExtractor, lxml
+from services.http_session import get_session, DEFAULT_TIMEOUT
+from services.article_store import ArticleStore
+
+
+def baseline_extract(html, url):
+    soup = BeautifulSoup(html, "html.parser")
+    paragraphs = soup.find_all("p")
+    return "\n".join([p.get_text() for p in paragraphs if len(p.get_text()) > 50])
+
+
+def load_pages():
+    pages = []
+    for news in ArticleStore().all():
+        try:
+            response = get_session().get(news["link"], timeout=DEFAULT_TIMEOUT)
+            response.raise_for_status()
+            pages.append((news["link"], response.text))
+        except Exception as e:
+            print(f"skipping {news['link']}: {e}")
+    return pages
+
+
+def time_extractor(extract, pages, rounds):
+    start = time.process_time()
+    for _ in range(rounds):
+        for url, html in pages:
+            extract(html, url)
+    return (time.process_time() - start) / (rounds * len(pages))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pages = load_pages()
+    if not pages:
+        print("No pages available to benchmark")
+        return
+    print(f"{len(pages)} pages, {sum(len(html) for _, html in pages) // len(pages)} bytes avg, {rounds} rounds")
+
+    candidates = [("html.parser full document", baseline_extract),
+                  ("bs4 container strainer", ArticleExtractor("bs4").extract)]
+    if lxml is not None:
+        candidates.append(("lxml container", ArticleExtractor("lxml").extract))
+
+    baseline = None
+    for name, extract in candidates:
+        per_page = time_extractor(extract, pages, rounds)
+        baseline = baseline or per_page
+        print(f"{name:28s} {per_page * 1000:8.2f} ms/page  {baseline / per_page:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
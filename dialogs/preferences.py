@@ -16,8 +16,10 @@ class PreferencesDialog(QDialog):
         tabs = QTabWidget()
         accounts_tab = QWidget()
         groups_tab = QWidget()
+        feeds_tab = QWidget()
         tabs.addTab(accounts_tab, "Accounts")
         tabs.addTab(groups_tab, "Groups")
+        tabs.addTab(feeds_tab, "Feeds")
         layout.addWidget(tabs)
 
         accounts_layout = QVBoxLayout(accounts_tab)
@@ -74,6 +76,26 @@ class PreferencesDialog(QDialog):
         remove_group_button.clicked.connect(self.remove_quora_group)
         groups_layout.addLayout(group_buttons_layout)
 
+        feeds_layout = QVBoxLayout(feeds_tab)
+        self.feeds_list = QListWidget()
+        for feed in self.parent.rss_feeds:
+            self.feeds_list.addItem(feed)
+        feeds_layout.addWidget(self.feeds_list, stretch=1)
+
+        feed_buttons_layout = QHBoxLayout()
+        add_feed_button = QPushButton("Add Feed")
+        edit_feed_button = QPushButton("Edit Feed")
+        remove_feed_button = QPushButton("Remove Feed")
+
+        feed_buttons_layout.addWidget(add_feed_button)
+        feed_buttons_layout.addWidget(edit_feed_button)
+        feed_buttons_layout.addWidget(remove_feed_button)
+
+        add_feed_button.clicked.connect(self.add_feed)
+        edit_feed_button.clicked.connect(self.edit_feed)
+        remove_feed_button.clicked.connect(self.remove_feed)
+        feeds_layout.addLayout(feed_buttons_layout)
+
         save_button = QPushButton("Save")
         save_button.clicked.connect(self.save_preferences)
         layout.addWidget(save_button)
@@ -101,6 +123,29 @@ class PreferencesDialog(QDialog):
         for item in selected_items:
             self.quora_groups_list.takeItem(self.quora_groups_list.row(item))
 
+    def add_feed(self):
+        feed_url, ok = QInputDialog.getText(self, "Add Feed", "Enter RSS Feed URL:")
+        if ok and feed_url.strip():
+            self.feeds_list.addItem(feed_url.strip())
+
+    def edit_feed(self):
+        selected_items = self.feeds_list.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "No Selection", "Please select a feed to edit.")
+            return
+        item = selected_items[0]
+        new_url, ok = QInputDialog.getText(self, "Edit Feed", "Edit RSS Feed URL:", text=item.text())
+        if ok and new_url.strip():
+            item.setText(new_url.strip())
+
+    def remove_feed(self):
+        selected_items = self.feeds_list.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "No Selection", "Please select a feed to remove.")
+            return
+        for item in selected_items:
+            self.feeds_list.takeItem(self.feeds_list.row(item))
+
     def save_preferences(self):
         self.parent.quora_email = self.quora_email.text()
         self.parent.quora_password = self.quora_pass.text()
@@ -111,6 +156,7 @@ class PreferencesDialog(QDialog):
         self.parent.logo_url = self.logo_url.text()
         self.parent.output_image_url = self.output_url.text()
         self.parent.quora_groups = [self.quora_groups_list.item(i).text() for i in range(self.quora_groups_list.count())]
+        self.parent.rss_feeds = [self.feeds_list.item(i).text() for i in range(self.feeds_list.count())]
         self.parent.save_config()
         self.parent.status_label.setText("Preferences saved")
         self.accept()
\ No newline at end of file
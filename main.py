@@ -2,21 +2,18 @@ import sys
 import os
 import platform
 os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget, QPushButton, QTextEdit, QProgressBar, QCheckBox, QMenuBar, QTabWidget, QMessageBox, QDialog, QFrame
+from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem, QPushButton, QTextEdit, QProgressBar, QCheckBox, QMenuBar, QTabWidget, QMessageBox, QDialog, QFrame
 from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QIcon, QAction, QTextCharFormat, QTextCursor, QFont, QColor
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PIL import Image, ImageDraw
-from io import BytesIO
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import tweepy
 import feedparser
-import requests
 import pyperclip
+import concurrent.futures
+import threading
 import time
 import json
 import logging
@@ -30,10 +27,32 @@ from threads.image_preprocessing import ImagePreprocessingThread
 from threads.chrome_driver import ChromeDriverThread
 from threads.scheduler import SchedulerThread
 from threads.log_update import LogUpdateThread
+from threads.cache_eviction import CacheEvictionThread
+from threads.x_posting import XPostingThread
 from dialogs.preferences import PreferencesDialog
 from dialogs.schedule import ScheduleDialog
+from services.http_session import configure_session
+from services.article_store import ArticleStore
+from services.cache_manager import CacheManager
+from services.phash import duplicate_groups
+from services.x_client import MediaCache, get_clients, post_tweet
+from services.rate_limit import RateLimiter
+from services.browser_waits import wait_for, cookie_present, more_elements, enabled_and_clickable
+from services.quora_session import QuoraSession, QUORA_LOGIN_COOKIE, PROFILE_DIR
+from services.driver_pool import DriverPool
+from services.resource_policy import DEFAULT_POLICY, navigate
+from services.image_pipeline import ImagePipeline, DEFAULT_PROFILES
 
 
+QUORA_COMPOSE_MODES = ("insert", "paste", "type")
+# Inserts at the caret through the editor's own input path, so active bold/quote formatting applies
+INSERT_TEXT_SCRIPT = "return document.execCommand('insertText', false, arguments[0]);"
+
+EDITOR_IMAGES = (By.XPATH, '//div[@contenteditable="true"]//img')
+SUBMIT_BUTTON = (By.XPATH, '//button[contains(@class, "qu-bg--blue")]')
+
+DUPLICATE_TOOLTIP = "Shares its image with the other"
+
 # Setup logging
 logging.basicConfig(filename='news_poster.log', level=logging.INFO, 
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -46,19 +65,35 @@ class NewsPosterApp(QMainWindow):
     def __init__(self):
         QMainWindow.__init__(self)
         self.news_data = []
+        self.articles_by_id = {}
         self.selected_news = []  # Tracks articles in queue_list
-        self.selected_news_indices = []  # Tracks indices in queue_list
+        self.selected_news_ids = []  # Tracks article IDs in queue_list
         self.driver = None
         self.article_cache = {}
         self.schedule_interval = None
         self.scheduler_timer = None
         self.log_update_thread = None
+        self.cache_eviction_thread = None
         self.fetch_threads = {}
+        self.fetch_thread = None
+        self.x_thread = None
+        self.last_fetch_stats = None
         self.current_preview_url = None
         self.web_view = QWebEngineView()
 
         self.config_file = "config.json"
         self.load_config()
+        configure_session(pool_size=self.fetch_max_connections)
+        self.article_store = ArticleStore()
+        self.image_pipeline = ImagePipeline(io_workers=self.fetch_max_connections, log_file='news_poster.log')
+        self.media_cache = MediaCache()
+        self.quora_session = QuoraSession(self.chrome_profile_dir)
+        self.clipboard_lock = threading.Lock()
+        self.driver_pool = DriverPool(self.quora_session, self.dologin, size=self.driver_pool_size,
+                                      headless=self.driver_pool_headless, block_policy=self.browser_block_policy)
+        if self.driver_pool_warm_on_start and self.quora_groups:
+            self.driver_pool.warm()
+        self.x_rate_limiter = RateLimiter()  # shared by the X worker and the scheduler
 
         self.setWindowTitle("News Poster")
         self.set_app_icon()
@@ -66,6 +101,7 @@ class NewsPosterApp(QMainWindow):
         # Setup UI
         self.setup_ui()
         self.start_log_update_thread()
+        self.start_cache_eviction_thread()
         self.update_fetch_cached_button()
 
     def load_config(self):
@@ -79,7 +115,22 @@ class NewsPosterApp(QMainWindow):
             "logo_url": r"D:\Desktop\MyNews\new_york_post_logo.png",
             "output_image_url": r"D:\Desktop\MyNews\output.png",
             "quora_groups": ["https://fubarmemesandmusic.quora.com/"],
-            "predefined_selection": []
+            "predefined_selection": [],
+            "rss_feeds": ["https://nypost.com/politics/feed/"],
+            "fetch_max_connections": 16,
+            "fetch_max_per_host": 4,
+            "cache_max_age_days": 7,
+            "cache_max_articles": 500,
+            "cache_max_bytes": 200 * 1024 * 1024,
+            "cache_eviction_interval_minutes": 30,
+            "output_profiles": DEFAULT_PROFILES,
+            "quora_compose_mode": "insert",
+            "chrome_profile_dir": PROFILE_DIR,
+            "driver_pool_size": 2,
+            "driver_pool_headless": True,
+            "driver_pool_warm_on_start": True,
+            "quora_parallel_groups": 2,
+            "browser_block_policy": DEFAULT_POLICY
         }
         if os.path.exists(self.config_file):
             with open(self.config_file, 'r') as f:
@@ -95,8 +146,28 @@ class NewsPosterApp(QMainWindow):
         self.logo_url = self.config["logo_url"]
         self.output_image_url = self.config["output_image_url"]
         self.quora_groups = self.config["quora_groups"]
+        self.rss_feeds = self.config.get("rss_feeds", defaults["rss_feeds"])
+        self.fetch_max_connections = self.config.get("fetch_max_connections", defaults["fetch_max_connections"])
+        self.fetch_max_per_host = self.config.get("fetch_max_per_host", defaults["fetch_max_per_host"])
+        self.cache_max_age_days = self.config.get("cache_max_age_days", defaults["cache_max_age_days"])
+        self.cache_max_articles = self.config.get("cache_max_articles", defaults["cache_max_articles"])
+        self.cache_max_bytes = self.config.get("cache_max_bytes", defaults["cache_max_bytes"])
+        self.cache_eviction_interval_minutes = self.config.get("cache_eviction_interval_minutes", defaults["cache_eviction_interval_minutes"])
+        self.output_profiles = self.config.get("output_profiles", defaults["output_profiles"])
+        self.quora_compose_mode = self.config.get("quora_compose_mode", defaults["quora_compose_mode"])
+        self.chrome_profile_dir = self.config.get("chrome_profile_dir", defaults["chrome_profile_dir"])
+        self.driver_pool_size = self.config.get("driver_pool_size", defaults["driver_pool_size"])
+        self.driver_pool_headless = self.config.get("driver_pool_headless", defaults["driver_pool_headless"])
+        self.driver_pool_warm_on_start = self.config.get("driver_pool_warm_on_start", defaults["driver_pool_warm_on_start"])
+        self.quora_parallel_groups = self.config.get("quora_parallel_groups", defaults["quora_parallel_groups"])
+        self.browser_block_policy = self.config.get("browser_block_policy", defaults["browser_block_policy"])
+        if self.quora_compose_mode not in QUORA_COMPOSE_MODES:
+            logging.warning(f"Unknown quora_compose_mode {self.quora_compose_mode!r}; using 'insert'.")
+            self.quora_compose_mode = "insert"
         try:
-            self.predefined_selection = [int(idx) for idx in self.config["predefined_selection"] if str(idx).isdigit()]
+            self.predefined_selection = [idx for idx in self.config["predefined_selection"] if isinstance(idx, str)]
+            if len(self.predefined_selection) != len(self.config["predefined_selection"]):
+                logging.warning("Dropped positional entries from predefined_selection; it now stores article IDs.")
         except (ValueError, TypeError, KeyError) as e:
             logging.warning(f"Invalid predefined_selection in config: {e}. Resetting to empty list.")
             self.predefined_selection = []
@@ -112,7 +183,22 @@ class NewsPosterApp(QMainWindow):
             "logo_url": self.logo_url,
             "output_image_url": self.output_image_url,
             "quora_groups": self.quora_groups,
-            "predefined_selection": self.predefined_selection
+            "predefined_selection": self.predefined_selection,
+            "rss_feeds": self.rss_feeds,
+            "fetch_max_connections": self.fetch_max_connections,
+            "fetch_max_per_host": self.fetch_max_per_host,
+            "cache_max_age_days": self.cache_max_age_days,
+            "cache_max_articles": self.cache_max_articles,
+            "cache_max_bytes": self.cache_max_bytes,
+            "cache_eviction_interval_minutes": self.cache_eviction_interval_minutes,
+            "output_profiles": self.output_profiles,
+            "quora_compose_mode": self.quora_compose_mode,
+            "chrome_profile_dir": self.chrome_profile_dir,
+            "driver_pool_size": self.driver_pool_size,
+            "driver_pool_headless": self.driver_pool_headless,
+            "driver_pool_warm_on_start": self.driver_pool_warm_on_start,
+            "quora_parallel_groups": self.quora_parallel_groups,
+            "browser_block_policy": self.browser_block_policy
         }
         with open(self.config_file, 'w') as f:
             json.dump(self.config, f)
@@ -275,13 +361,7 @@ class NewsPosterApp(QMainWindow):
         left_layout.addWidget(self.status_label)
 
     def update_fetch_cached_button(self):
-        cache_file = "news_cache.json"
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            self.fetch_cached_button.setEnabled(bool(data))
-        else:
-            self.fetch_cached_button.setEnabled(False)
+        self.fetch_cached_button.setEnabled(self.article_store.has_articles())
 
     def start_log_update_thread(self):
         self.log_update_thread = LogUpdateThread(self, "news_poster.log")
@@ -293,15 +373,60 @@ class NewsPosterApp(QMainWindow):
             self.log_update_thread.stop()
             self.log_update_thread.wait()
 
+    def image_output_dir(self):
+        return os.path.dirname(self.output_image_url) if self.output_image_url else "downloaded_images"
+
+    def start_cache_eviction_thread(self):
+        cache_manager = CacheManager(self.article_store, self.image_output_dir(),
+                                     max_age_days=self.cache_max_age_days,
+                                     max_articles=self.cache_max_articles,
+                                     max_bytes=self.cache_max_bytes,
+                                     logo_url=self.logo_url)
+        self.cache_eviction_thread = CacheEvictionThread(self, cache_manager, self.cache_eviction_interval_minutes,
+                                                         lambda: list(self.selected_news_ids), self.fetch_running)
+        self.cache_eviction_thread.evicted.connect(self.on_cache_evicted)
+        self.cache_eviction_thread.start()
+
+    def fetch_running(self):
+        return self.fetch_thread is not None and self.fetch_thread.isRunning()
+
+    def stop_cache_eviction_thread(self):
+        if self.cache_eviction_thread:
+            self.cache_eviction_thread.stop()
+            self.cache_eviction_thread.wait()
+
+    def on_cache_evicted(self, evicted_ids):
+        # The rows are gone from the store, so their stories can no longer be loaded; drop them from the UI too
+        evicted_ids = set(evicted_ids)
+        self.set_news_data([news for news in self.news_data if news['id'] not in evicted_ids])
+        for row in reversed(range(self.list_widget.count())):
+            if self.list_widget.item(row).data(Qt.UserRole) in evicted_ids:
+                self.list_widget.takeItem(row)
+        if evicted_ids.intersection(self.selected_news_ids):
+            self.update_queue_list()
+        self.update_fetch_cached_button()
+
+    def set_news_data(self, news_data):
+        self.news_data = news_data
+        self.articles_by_id = {news['id']: news for news in news_data}
+
+    def add_article_item(self, news, filter_text):
+        if filter_text and filter_text not in news['title'].lower():
+            return
+        item = QListWidgetItem(news['title'])
+        item.setData(Qt.UserRole, news['id'])
+        self.list_widget.addItem(item)
+        if news['id'] in self.predefined_selection:
+            item.setSelected(True)
+
     def update_list_widget(self):
         self.list_widget.clear()
         filter_text = self.filter_input.text().lower()
-        for i, news in enumerate(self.news_data):
-            if not filter_text or filter_text in news['title'].lower():
-                self.list_widget.addItem(f"{i}: {news['title']}")
-        for idx in self.predefined_selection:
-            if idx < self.list_widget.count():
-                self.list_widget.item(idx).setSelected(True)
+        for news in self.news_data:
+            self.add_article_item(news, filter_text)
+
+    def selected_article_ids(self):
+        return [item.data(Qt.UserRole) for item in self.list_widget.selectedItems()]
 
     def filter_articles(self):
         self.update_list_widget()
@@ -309,28 +434,29 @@ class NewsPosterApp(QMainWindow):
     def update_queue_list(self):
         """Update queue_list based on the current selection in list_widget."""
         selected_items = self.list_widget.selectedItems()
-        selected_indices = [int(item.text().split(":")[0]) for item in selected_items]
+        selected_ids = self.selected_article_ids()
 
         # Create a new list of articles to be in the queue
         new_selected_news = []
-        new_selected_indices = []
+        new_selected_ids = []
         new_queue_items = []
 
-        for idx in selected_indices:
-            if 0 <= idx < len(self.news_data):
-                news_item = self.news_data[idx]
+        for article_id in selected_ids:
+            news_item = self.articles_by_id.get(article_id)
+            if news_item is not None:
                 new_selected_news.append(news_item)
-                new_selected_indices.append(idx)
+                new_selected_ids.append(article_id)
                 new_queue_items.append(f"- {news_item['title']}")
 
         # Update the data structures
         self.selected_news = new_selected_news
-        self.selected_news_indices = new_selected_indices
+        self.selected_news_ids = new_selected_ids
 
         # Update the queue_list UI
         self.queue_list.clear()
         for item in new_queue_items:
             self.queue_list.addItem(item)
+        self.mark_duplicate_images()
 
         # Log the action
         if selected_items:
@@ -341,74 +467,6 @@ class NewsPosterApp(QMainWindow):
             logging.info("Queue list cleared (no articles selected)")
             self.status_label.setText("Queue cleared")
 
-    def download_image(self, url_or_path):
-        logging.info(f"Attempting to download image from: {url_or_path}")
-        if os.path.isfile(url_or_path):
-            try:
-                img = Image.open(url_or_path).convert("RGBA")
-                logging.info(f"Successfully downloaded image from {url_or_path}")
-                return img
-            except Exception as e:
-                logging.error(f"Failed to load local image from {url_or_path}: {e}")
-                return None
-        try:
-            response = requests.get(url_or_path, timeout=300)
-            if response.status_code == 200:
-                img = Image.open(BytesIO(response.content)).convert("RGBA")
-                logging.info(f"Successfully downloaded image from {url_or_path}")
-                return img
-            else:
-                logging.error(f"Failed to download image from {url_or_path}: HTTP {response.status_code}")
-                return None
-        except Exception as e:
-            logging.error(f"Failed to download image from {url_or_path}: {e}")
-            return None
-
-    def add_rounded_corners(self, im, radius):
-        if im is None:
-            return None
-        rounded_mask = Image.new("L", im.size, 0)
-        draw = ImageDraw.Draw(rounded_mask)
-        draw.rounded_rectangle([(0, 0), im.size], radius=radius, fill=255)
-        im.putalpha(rounded_mask)
-        return im
-
-    def add_logo(self, image_url, logo_url, margin=20):
-        image = self.download_image(image_url)
-        if image is None:
-            image = Image.new("RGBA", (300, 200), (255, 255, 255, 0))
-
-        aspect_ratio = image.width / image.height
-        max_size = 1024
-        if image.width > image.height:
-            new_width = min(image.width, max_size)
-            new_height = int(new_width / aspect_ratio)
-        else:
-            new_height = min(image.height, max_size)
-            new_width = int(new_height * aspect_ratio)
-
-        image = image.resize((new_width, new_height), Image.LANCZOS)
-
-        logo = self.download_image(logo_url)
-        if logo is None:
-            return image
-
-        logo_width = image.width // 7
-        logo_height = int(logo.height * (logo_width / logo.width))
-        logo = logo.resize((logo_width, logo_height), Image.LANCZOS)
-        logo = self.add_rounded_corners(logo, radius=20)
-        if logo is None:
-            return image
-
-        x_pos = image.width - logo_width - margin
-        y_pos = image.height - logo_height - margin
-        try:
-            image.paste(logo, (x_pos, y_pos), logo)
-            return image
-        except Exception as e:
-            logging.error(f"Failed to paste logo onto image: {e}")
-            return image
-
     def show_preprocessing_dialog(self, total_items):
         dialog = QDialog(self)
         dialog.setWindowTitle("Preprocessing Images")
@@ -430,30 +488,59 @@ class NewsPosterApp(QMainWindow):
         dialog.show()
         return dialog, progress_bar
 
-    def preprocess_images(self, callback):
+    def preprocess_images(self, callback, ready=None):
+        """Process queued images, then call callback; ready[i] (threading.Event) is set as each article's images land."""
         if not self.selected_news:
             callback()
             return
 
         dialog, progress_bar = self.show_preprocessing_dialog(len(self.selected_news))
-        output_dir = os.path.dirname(self.output_image_url) if self.output_image_url else "downloaded_images"
-        self.image_thread = ImagePreprocessingThread(self, self.selected_news, self.logo_url, output_dir)
+        output_dir = self.image_output_dir()
+        self.image_thread = ImagePreprocessingThread(self, self.selected_news, self.logo_url, output_dir,
+                                                     self.image_pipeline, self.output_profiles)
         self.image_thread.progress.connect(progress_bar.setValue)
+        if ready:
+            self.image_thread.item_ready.connect(lambda index: ready[index].set())
+            self.image_thread.finished.connect(lambda: [event.set() for event in ready])
+            # Unprocessed articles still point at their raw source URL; post nothing more rather than imageless posts
+            self.image_thread.error.connect(lambda *args: self.chrome_thread.cancel())
         self.image_thread.finished.connect(dialog.accept)
+        self.image_thread.finished.connect(self.mark_duplicate_images)
         self.image_thread.finished.connect(callback)
         self.image_thread.error.connect(self.show_error_message)
         self.image_thread.start()
 
+    def mark_duplicate_images(self):
+        """Label queued articles whose source photos are near-identical, so one processed image serves the group."""
+        groups = duplicate_groups((index, news.get("image_hash")) for index, news in enumerate(self.selected_news))
+        for index, news in enumerate(self.selected_news):
+            item = self.queue_list.item(index)
+            if item is None:
+                continue
+            group = groups.get(index)
+            item.setText(f"- {news['title']}" + (f"  [same image #{group}]" if group else ""))
+            # Keep the per-group posting results update_group_status may already have written
+            lines = [line for line in item.toolTip().splitlines() if not line.startswith(DUPLICATE_TOOLTIP)]
+            if group:
+                lines.insert(0, f"{DUPLICATE_TOOLTIP} [same image #{group}] articles")
+            item.setToolTip("\n".join(lines))
+        if groups:
+            logging.info(f"{len(groups)} queued articles share {len(set(groups.values()))} image group(s)")
+
+    def image_for(self, content, destination):
+        """Processed image variant for a destination ("x", "quora"), falling back to the default image."""
+        variants = content.get("image_variants") or {}
+        return variants.get(destination) or content['image']
+
     def check_captcha(self, driver):
         return "turnstile" in driver.page_source.lower() or "verify you are human" in driver.page_source.lower()
 
     def click_turnstile(self, driver):
         try:
-            wait = WebDriverWait(driver, 10)
-            captcha = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "cf-turnstile")))
+            captcha = wait_for(driver, "captcha_widget", EC.presence_of_element_located((By.CLASS_NAME, "cf-turnstile")))
             checkbox = captcha.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
             ActionChains(driver).move_to_element(checkbox).click().perform()
-            time.sleep(5)
+            wait_for(driver, "captcha_cleared", EC.invisibility_of_element_located((By.CLASS_NAME, "cf-turnstile")))
             return True
         except Exception as e:
             logging.error(f"CAPTCHA click failed: {e}")
@@ -461,118 +548,144 @@ class NewsPosterApp(QMainWindow):
 
     def dologin(self, driver):
         try:
-            email_field = driver.find_element(By.NAME, "email")
+            email_field = wait_for(driver, "login_form", EC.presence_of_element_located((By.NAME, "email")))
             password_field = driver.find_element(By.NAME, "password")
             email_field.send_keys(self.quora_email)
             password_field.send_keys(self.quora_password)
             password_field.send_keys(Keys.RETURN)
-            driver.find_element(By.XPATH, '//button[contains(@class, "qu-bg--blue")]').click()
-            time.sleep(10)
+            login_buttons = driver.find_elements(*SUBMIT_BUTTON)
+            if login_buttons and driver.get_cookie(QUORA_LOGIN_COOKIE) is None:
+                login_buttons[0].click()
+            wait_for(driver, "login_cookie", cookie_present(QUORA_LOGIN_COOKIE))
+            return True
         except Exception as e:
             logging.error(f"Login failed: {e}")
+            return False
 
     def simulate_writing(self, text, action_chain):
         for char in text:
             action_chain.send_keys(char).pause(0.0005)
         return action_chain
 
-    def post_toquora(self, driver, content, group_urls, template):
-        wait = WebDriverWait(driver, 60) #increases timeout to 60 seconds
-        for group_url in group_urls:
+    def insert_block(self, driver, text, action_chain):
+        if self.quora_compose_mode == "paste":
+            # One system clipboard for every driver posting in parallel
+            with self.clipboard_lock:
+                pyperclip.copy(text)
+                action_chain.key_down(Keys.CONTROL).send_keys("v").key_up(Keys.CONTROL).perform()
+        elif not driver.execute_script(INSERT_TEXT_SCRIPT, text):
+            raise RuntimeError("editor rejected insertText")
+
+    def write_text(self, driver, text, action_chain):
+        """Enter text at the caret one line per operation; "type" mode (or a failed insert) types it per character."""
+        lines = text.split("\n")
+        written = 0
+        if self.quora_compose_mode != "type":
+            try:
+                for line in lines:
+                    if line:
+                        self.insert_block(driver, line, action_chain)
+                    written += 1
+                    if written < len(lines):
+                        action_chain.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+                return
+            except Exception as e:
+                logging.warning(f"Bulk text insertion failed ({e}); typing the rest character by character")
+        self.simulate_writing("\n".join(lines[written:]), action_chain).perform()
+
+    def post_to_quora_group(self, driver, content, group_url):
+        """Compose and submit one article in one group; raises on failure."""
+        started = time.monotonic()
+        logging.info(f"Navigating to Quora group: {group_url}")
+        navigate(driver, group_url)
+
+        #CAPTCHA Handling
+        if self.check_captcha(driver):
+            logging.info("CAPTCHA detected, attempting to solve...")
+            if not self.click_turnstile(driver):
+                raise Exception("Failed to handle CAPTCHA")
+
+        # Locate and click the post trigger
+        trigger_post_box = wait_for(driver, "post_trigger", EC.element_to_be_clickable((By.XPATH, '//div[contains(text(), "Post in ")]')))
+        trigger_post_box.click()
+
+        # Locate and interact with the post box
+        post_box = wait_for(driver, "post_box", EC.element_to_be_clickable((By.XPATH, '//div[@contenteditable="true"]')))
+        post_box.click()
+        act = ActionChains(driver)
+
+        # Clearing in case previous post failed
+        logging.info(f"Clearing the previous junk (if any)")
+        act.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
+        act.key_down(Keys.DELETE).key_up(Keys.DELETE).perform()
+
+        # Posting Title
+        logging.info(f"Posting title: {content['title']}")
+        act.key_down(Keys.CONTROL).send_keys("b").key_up(Keys.CONTROL).perform()
+        self.write_text(driver, content['title'], act)
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+
+        # Posting summary
+        summ = content['summary'].strip('[]')
+        act.key_down(Keys.CONTROL).key_down(Keys.SHIFT).send_keys('9').key_up(Keys.SHIFT).key_up(Keys.CONTROL).perform()
+        self.write_text(driver, summ, act)
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+
+        # Posting Fullstory
+        self.write_text(driver, content['fullstory'], act)
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+
+        # Posting link
+        self.write_text(driver, content['link'], act)
+        act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
+
+        # Handle image upload 
+        image = self.image_for(content, "quora")
+        if image:
+            try:
+                logging.info(f"Uploading image: {image}")
+                image_input = wait_for(driver, "upload_input", EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file']")))
+                images_before = len(driver.find_elements(*EDITOR_IMAGES))
+                image_input.send_keys(image)
+                logging.info("Waiting for Image to uploaded")
+                wait_for(driver, "upload_thumbnail", more_elements(EDITOR_IMAGES, images_before))
+            except Exception as e:
+                logging.warning(f"Image upload failed: {e}")
+
+        #Submit Button
+        # Quora keeps submit disabled while the upload is still being processed
+        submit_button = wait_for(driver, "submit_enabled", enabled_and_clickable(SUBMIT_BUTTON))
+        submit_button.click()
+        #wait.until(EC.presence_of_element_located((By.XPATH, '//div[contains(text(), "posted")]')))  # Confirm posting
+        logging.info(f"Posted to Quora: {content['title']} in {group_url} ({time.monotonic() - started:.1f}s)")
+
+    def post_toquora(self, content, group_urls, template):
+        """Post an article to every group, quora_parallel_groups at a time on pooled drivers.
+
+        Returns {group_url: error message, or None on success}.
+        """
+        def post(group_url):
             try:
-                logging.info(f"Navigating to Quora group: {group_url}")
-                driver.get(group_url)
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))  # Wait for page load
-                
-                #CAPTCHA Handling
-                if self.check_captcha(driver):
-                    logging.info("CAPTCHA detected, attempting to solve...")
-                    if not self.click_turnstile(driver):
-                        raise Exception("Failed to handle CAPTCHA")
-                    wait.until_not(EC.presence_of_element_located((By.CLASS_NAME, "cf-turnstile")))  # Wait for CAPTCHA to clear
-                    
-                # Locate and click the post trigger
-                trigger_post_box = wait.until(EC.element_to_be_clickable((By.XPATH, '//div[contains(text(), "Post in ")]')))
-                trigger_post_box.click()
-                
-                # Locate and interact with the post box
-                post_box = wait.until(EC.element_to_be_clickable((By.XPATH, '//div[@contenteditable="true"]')))
-                post_box.click()
-                act = ActionChains(driver)
-
-                # Clearing in case previous post failed
-                logging.info(f"Clearing the previous junk (if any)")
-                act.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
-                act.key_down(Keys.DELETE).key_up(Keys.DELETE).perform()
-                
-                # Posting Title
-                logging.info(f"Posting title: {content['title']}")
-                pyperclip.copy(content['title'])
-                act.key_down(Keys.CONTROL).send_keys("b").key_up(Keys.CONTROL).perform()
-                self.simulate_writing(content['title'], act).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                
-                # Posting summary
-                summ = content['summary'].strip('[]')
-                act.key_down(Keys.CONTROL).key_down(Keys.SHIFT).send_keys('9').key_up(Keys.SHIFT).key_up(Keys.CONTROL).perform()
-                self.simulate_writing(summ, act).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                
-                # Posting Fullstory
-                self.simulate_writing(content['fullstory'], act).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                
-                # Posting link
-                self.simulate_writing(content['link'], act).perform()
-                act.key_down(Keys.ENTER).key_up(Keys.ENTER).perform()
-                
-                # Handle image upload 
-                if content['image']:
-                    try:
-                        logging.info(f"Uploading image: {content['image']}")
-                        image_input = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file']")))
-                        image_input.send_keys(content['image'])
-                        #wait.until(EC.presence_of_element_located((By.XPATH, '//img[contains(@src, "upload")]')))  # Confirm upload
-                        logging.info("Waiting for Image to uploaded")
-                        time.sleep(30)
-                    except Exception as e:
-                        logging.warning(f"Image upload failed: {e}")
-                
-                #Submit Button
-                submit_button = wait.until(EC.element_to_be_clickable((By.XPATH, '//button[contains(@class, "qu-bg--blue")]')))
-                submit_button.click()
-                #wait.until(EC.presence_of_element_located((By.XPATH, '//div[contains(text(), "posted")]')))  # Confirm posting
-                logging.info(f"Posted to Quora: {content['title']}")
-            
+                with self.driver_pool.driver() as driver:
+                    self.post_to_quora_group(driver, content, group_url)
+                return None
             except Exception as e:
-                logging.error(f"Quora posting failed for {content['title']}: {str(e)}")
-                raise  # Re-raise to let ChromeDriverThread handle it
-        act.perform()
+                logging.error(f"Quora posting failed for {content['title']} in {group_url}: {str(e)}")
+                return str(e) or type(e).__name__
 
-    def post_to_twitter(self, content, queue_index):
-        try:
-            client = tweepy.Client(
-                consumer_key=self.twitter_api_key,
-                consumer_secret=self.twitter_api_secret,
-                access_token=self.twitter_access_token,
-                access_token_secret=self.twitter_access_secret
-            )
-            tweet = f"{content['title']} {content['link']}"[:280]
-            if content['image']:
-                auth = tweepy.OAuthHandler(self.twitter_api_key, self.twitter_api_secret)
-                auth.set_access_token(self.twitter_access_token, self.twitter_access_secret)
-                api = tweepy.API(auth)
-                media = api.media_upload(content['image'])
-                client.create_tweet(text=tweet, media_ids=[media.media_id])
-            else:
-                client.create_tweet(text=tweet)
-            logging.info(f"Posted to Twitter: {content['title']}")
-            self.update_queue_status(queue_index, True)
-        except Exception as e:
-            logging.error(f"Twitter posting failed: {e}")
-            self.update_queue_status(queue_index, False)
+        workers = max(1, min(self.quora_parallel_groups, len(group_urls)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(group_urls, executor.map(post, group_urls)))
+
+    def x_credentials(self):
+        return (self.twitter_api_key, self.twitter_api_secret, self.twitter_access_token, self.twitter_access_secret)
+
+    def post_to_twitter(self, content):
+        """Post one article to X from any thread; raises on failure."""
+        post_tweet(get_clients(*self.x_credentials()), self.media_cache, content, self.image_for(content, "x"),
+                   self.x_rate_limiter)
 
     def update_queue_status(self, index, success):
         item = self.queue_list.item(index)
@@ -584,34 +697,30 @@ class NewsPosterApp(QMainWindow):
             item.setBackground(QColor("#ff5555"))
             item.setForeground(QColor("#f8f8f2"))
 
-    def remove_from_cache(self, queue_index):
-        cache_file = "news_cache.json"
-        if not os.path.exists(cache_file):
+    def update_group_status(self, index, group_url, success):
+        item = self.queue_list.item(index)
+        if item is None:
             return
+        line = f"{group_url}: {'posted' if success else 'failed'}"
+        item.setToolTip(f"{item.toolTip()}\n{line}" if item.toolTip() else line)
 
+    def remove_from_cache(self, queue_index):
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-
-            news_index = self.selected_news_indices[queue_index]
-            if news_index < len(cache_data):
-                news_item = cache_data[news_index]
-                image_path = news_item.get("image")
-                if image_path and os.path.exists(image_path):
-                    try:
-                        os.remove(image_path)
-                        logging.info(f"Deleted image: {image_path}")
-                    except Exception as e:
-                        logging.error(f"Failed to delete image {image_path}: {e}")
-
-                cache_data.pop(news_index)
-                with open(cache_file, 'w') as f:
-                    json.dump(cache_data, f)
-
-                self.selected_news_indices = [idx if idx < news_index else idx - 1 for idx in self.selected_news_indices]
-                self.selected_news.pop(queue_index)
-                self.queue_list.takeItem(queue_index)
-                self.update_fetch_cached_button()
+            news_item = self.selected_news[queue_index]
+            image_path = news_item.get("image")
+            if image_path and os.path.exists(image_path):
+                try:
+                    os.remove(image_path)
+                    logging.info(f"Deleted image: {image_path}")
+                except Exception as e:
+                    logging.error(f"Failed to delete image {image_path}: {e}")
+
+            self.article_store.delete(news_item["id"])
+
+            self.selected_news_ids.pop(queue_index)
+            self.selected_news.pop(queue_index)
+            self.queue_list.takeItem(queue_index)
+            self.update_fetch_cached_button()
 
         except Exception as e:
             logging.error(f"Failed to update cache: {e}")
@@ -619,23 +728,48 @@ class NewsPosterApp(QMainWindow):
     def fetch_news(self):
         self.status_label.setText("Fetching news...")
         self.fetch_progress.setValue(0)
-        self.fetch_thread = FetchNewsThread(self, use_cache=False)
+        self.last_fetch_stats = None
+        self.set_news_data([])
+        self.list_widget.clear()
+        self.fetch_thread = FetchNewsThread(self, use_cache=False, incremental=True, feeds=self.rss_feeds,
+                                            max_connections=self.fetch_max_connections,
+                                            max_per_host=self.fetch_max_per_host, streaming=True,
+                                            store=self.article_store)
         self.fetch_thread.progress.connect(self.fetch_progress.setValue)
+        self.fetch_thread.fetch_stats.connect(self.on_fetch_stats)
+        self.fetch_thread.article_ready.connect(self.on_article_ready)
         self.fetch_thread.finished.connect(self.on_fetch_finished)
         self.fetch_thread.start()
 
     def fetch_news_cached(self):
         self.status_label.setText("Fetching cached news...")
         self.fetch_progress.setValue(0)
-        self.fetch_thread = FetchNewsThread(self, use_cache=True)
+        self.last_fetch_stats = None
+        self.fetch_thread = FetchNewsThread(self, use_cache=True, store=self.article_store)
         self.fetch_thread.progress.connect(self.fetch_progress.setValue)
         self.fetch_thread.finished.connect(self.on_fetch_finished)
         self.fetch_thread.start()
 
+    def on_fetch_stats(self, new_count, rescraped_count, unchanged_count, gone_count):
+        self.last_fetch_stats = (new_count, rescraped_count, unchanged_count, gone_count)
+
+    def on_article_ready(self, news):
+        self.news_data.append(news)
+        self.articles_by_id[news['id']] = news
+        self.add_article_item(news, self.filter_input.text().lower())
+        self.status_label.setText(f"Fetching news... {len(self.news_data)} articles ready")
+
     def on_fetch_finished(self, news_data):
-        self.news_data = news_data
-        self.update_list_widget()
-        self.status_label.setText("News fetched")
+        # Streaming fetches have already appended every article in this same order
+        self.set_news_data(news_data)
+        if not self.fetch_thread.streaming:
+            self.update_list_widget()
+        if self.last_fetch_stats:
+            new_count, rescraped_count, unchanged_count, gone_count = self.last_fetch_stats
+            self.status_label.setText(f"News fetched: {new_count} new, {rescraped_count} re-scraped, "
+                                      f"{unchanged_count} unchanged, {gone_count} gone")
+        else:
+            self.status_label.setText("News fetched")
         self.update_fetch_cached_button()
 
     def post_now(self):
@@ -651,37 +785,42 @@ class NewsPosterApp(QMainWindow):
             return
 
         self.status_label.setText("Preparing resources...")
-        self.preprocess_images(self.start_posting)
+        self.post_progress.setValue(0)
+        ready = None
+        if self.post_to_quora.isChecked():
+            # Browser launch/login and image processing overlap; each Quora post waits only for its own image
+            ready = [threading.Event() for _ in self.selected_news]
+            self.start_quora_posting(ready)
+        self.preprocess_images(self.start_posting, ready)
 
     def start_posting(self):
         self.status_label.setText("Starting posting...")
-        self.post_progress.setValue(0)
-
-        total_posts = len(self.selected_news)
-        posted_articles = set()  # Track posted articles to avoid duplicates
-        for i, news in enumerate(self.selected_news):
-            article_id = f"{news['title']}_{news['link']}"
-            if article_id in posted_articles:
-                continue
-            if self.post_to_x.isChecked():
-                self.post_to_twitter(news, i)
-                posted_articles.add(article_id)
-            self.post_progress.setValue((i + 1) * 100 // total_posts)
-            self.status_label.setText(f"Posting to X: {i + 1}/{total_posts}")
-            QApplication.processEvents()
 
-        if self.post_to_quora.isChecked():
-            template = self.logs_text.toPlainText()
-            self.chrome_thread = ChromeDriverThread(self, self.selected_news, self.quora_groups, template)
-            self.chrome_thread.status.connect(self.status_label.setText)
-            self.chrome_thread.progress.connect(self.post_progress.setValue)
-            self.chrome_thread.post_status.connect(self.update_queue_status)
-            self.chrome_thread.finished.connect(self.on_quora_posting_finished)
-            self.chrome_thread.error.connect(self.show_error_message)
-            self.chrome_thread.start()
+        if self.post_to_x.isChecked():
+            images = {i: self.image_for(news, "x") for i, news in enumerate(self.selected_news)}
+            self.x_thread = XPostingThread(self, self.selected_news, self.x_credentials(), self.media_cache, images,
+                                           self.x_rate_limiter)
+            self.x_thread.status.connect(self.status_label.setText)
+            self.x_thread.progress.connect(self.post_progress.setValue)
+            self.x_thread.post_status.connect(self.update_queue_status)
+            self.x_thread.finished.connect(self.update_logs)
+            self.x_thread.error.connect(self.show_error_message)
+            self.x_thread.start()
 
         self.update_logs()
 
+    def start_quora_posting(self, ready=None):
+        template = self.logs_text.toPlainText()
+        self.chrome_thread = ChromeDriverThread(self, self.selected_news, self.quora_groups, template, self.driver_pool,
+                                                ready)
+        self.chrome_thread.status.connect(self.status_label.setText)
+        self.chrome_thread.progress.connect(self.post_progress.setValue)
+        self.chrome_thread.post_status.connect(self.update_queue_status)
+        self.chrome_thread.group_status.connect(self.update_group_status)
+        self.chrome_thread.finished.connect(self.on_quora_posting_finished)
+        self.chrome_thread.error.connect(self.show_error_message)
+        self.chrome_thread.start()
+
     def on_quora_posting_finished(self):
         self.status_label.setText("Posting complete")
         self.update_logs()
@@ -714,6 +853,8 @@ class NewsPosterApp(QMainWindow):
             return
 
         self.status_label.setText("Preparing resources...")
+        if self.post_to_quora.isChecked():
+            self.driver_pool.warm()  # launch and log in while images are processed
         self.preprocess_images(lambda: self.start_scheduling(start_time))
 
     def start_scheduling(self, start_time):
@@ -728,7 +869,8 @@ class NewsPosterApp(QMainWindow):
             self.quora_groups,
             template,
             self.post_to_x.isChecked(),
-            self.post_to_quora.isChecked()
+            self.post_to_quora.isChecked(),
+            self.driver_pool
         )
         self.scheduler_thread.progress.connect(self.post_progress.setValue)
         self.scheduler_thread.status.connect(self.status_label.setText)
@@ -772,19 +914,21 @@ class NewsPosterApp(QMainWindow):
         if not selected_items:
             QMessageBox.warning(self, "No Selection", "Please select articles to save.")
             return
-        indices = [int(item.text().split(":")[0]) for item in selected_items]
         with open("selections.json", 'w') as f:
-            json.dump(indices, f)
+            json.dump(self.selected_article_ids(), f)
         self.status_label.setText("Selection saved")
 
     def load_selections(self):
         try:
             with open("selections.json", 'r') as f:
-                indices = json.load(f)
+                saved = json.load(f)
+            # Older selection files stored list positions instead of article IDs
+            saved_ids = {self.news_data[idx]['id'] if isinstance(idx, int) and idx < len(self.news_data) else idx for idx in saved}
             self.list_widget.clearSelection()
-            for idx in indices:
-                if idx < self.list_widget.count():
-                    self.list_widget.item(idx).setSelected(True)
+            for row in range(self.list_widget.count()):
+                item = self.list_widget.item(row)
+                if item.data(Qt.UserRole) in saved_ids:
+                    item.setSelected(True)
             self.status_label.setText("Selection loaded")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load selections: {e}")
@@ -798,7 +942,7 @@ class NewsPosterApp(QMainWindow):
         if not selected_items:
             QMessageBox.warning(self, "No Selection", "Please select articles first.")
             return
-        self.predefined_selection = [int(item.text().split(":")[0]) for item in selected_items]
+        self.predefined_selection = self.selected_article_ids()
         self.save_config()
         self.status_label.setText("Predefined selection saved")
         self.update_list_widget()
@@ -897,6 +1041,12 @@ class NewsPosterApp(QMainWindow):
 
     def closeEvent(self, event):
         self.stop_log_update_thread()
+        self.stop_cache_eviction_thread()
+        self.image_pipeline.shutdown()
+        self.driver_pool.shutdown()
+        self.x_rate_limiter.cancel()  # don't sit out a rate-limit window on exit
+        if self.x_thread and self.x_thread.isRunning():
+            self.x_thread.wait()
         for thread in self.fetch_threads.values():
             if thread.isRunning():
                 thread.quit()
@@ -0,0 +1,71 @@
+ARTICLE_FIELDS = ("id", "guid", "feed", "title", "summary", "fullstory", "link", "image", "source_image", "image_variants",
+                  "image_hash")
+# Placeholder stories written when a scrape fails; articles carrying them are scraped again on the next fetch
+STORY_UNAVAILABLE = "Full story not available."
+STORY_ERROR_PREFIX = "❌ Error fetching story:"
+
+
+class Article:
+    """Compact article record. fullstory stays in the store and is read only when something asks for it.
+
+    Supports the dict-style access (news['title'], news.get('image')) the rest of the app uses.
+    """
+
+    __slots__ = ("id", "guid", "feed", "title", "summary", "link", "image", "source_image", "image_variants", "image_hash",
+                 "_fullstory", "_store")
+
+    def __init__(self, id=None, guid=None, feed=None, title="", summary=None, link="", image=None, fullstory=None,
+                 source_image=None, image_variants=None, image_hash=None, store=None):
+        self.id = id
+        self.guid = guid
+        self.feed = feed
+        self.title = title
+        self.summary = summary
+        self.link = link
+        self.image = image
+        self.source_image = source_image
+        self.image_variants = image_variants
+        self.image_hash = image_hash
+        self._fullstory = fullstory
+        self._store = store
+
+    @property
+    def fullstory(self):
+        if self._fullstory is not None:
+            return self._fullstory
+        if self._store is not None and self.id:
+            return self._store.get_fullstory(self.id) or ""
+        return ""
+
+    @fullstory.setter
+    def fullstory(self, value):
+        self._fullstory = value
+
+    @property
+    def resident_fullstory(self):
+        return self._fullstory
+
+    def release_fullstory(self, store):
+        """Drop the in-memory text once it has been persisted to store."""
+        self._store = store
+        self._fullstory = None
+
+    def __getitem__(self, key):
+        if key not in ARTICLE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in ARTICLE_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in ARTICLE_FIELDS
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in ARTICLE_FIELDS else None
+        return default if value is None else value
+
+    def __repr__(self):
+        return f"Article(id={self.id!r}, title={self.title!r})"
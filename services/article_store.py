@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from services.article import Article, STORY_UNAVAILABLE, STORY_ERROR_PREFIX
+
+STORE_FILE = "news_cache.db"
+LEGACY_CACHE_FILE = "news_cache.json"
+SUMMARY_COLUMNS = "id, guid, feed, title, summary, link, image, source_image, image_variants, image_hash"
+
+# Applied in order; PRAGMA user_version records how many have run
+MIGRATIONS = [
+    """
+    CREATE TABLE articles (
+        guid TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        feed TEXT,
+        title TEXT NOT NULL,
+        summary TEXT,
+        fullstory TEXT,
+        link TEXT NOT NULL,
+        image TEXT,
+        fetched_at REAL NOT NULL
+    );
+    CREATE INDEX idx_articles_position ON articles(position);
+    CREATE INDEX idx_articles_link ON articles(link);
+    """,
+    """
+    ALTER TABLE articles ADD COLUMN id TEXT;
+    UPDATE articles SET id = article_id(guid);
+    CREATE UNIQUE INDEX idx_articles_id ON articles(id);
+    """,
+    """
+    CREATE INDEX idx_articles_fetched_at ON articles(fetched_at);
+    """,
+    """
+    ALTER TABLE articles ADD COLUMN source_image TEXT;
+    UPDATE articles SET source_image = image WHERE image LIKE 'http%';
+    CREATE INDEX idx_articles_image ON articles(image);
+    """,
+    """
+    ALTER TABLE articles ADD COLUMN image_variants TEXT;
+    CREATE INDEX idx_articles_source_image ON articles(source_image);
+    """,
+    """
+    ALTER TABLE articles ADD COLUMN image_hash TEXT;
+    """,
+]
+
+
+def article_id(key):
+    """Stable article ID derived from the entry GUID (or link when the feed has none)."""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def ensure_article_id(news):
+    if not news.get("id"):
+        news["id"] = article_id(news.get("guid") or news["link"])
+    return news["id"]
+
+
+class ArticleStore:
+    """SQLite (WAL) article store. Each thread gets its own connection; writers wait on busy_timeout."""
+
+    def __init__(self, path=STORE_FILE, legacy_json=LEGACY_CACHE_FILE):
+        self.path = path
+        self.local = threading.local()
+        self.init_lock = threading.Lock()
+        with self.init_lock:
+            self._migrate()
+            self._import_legacy_json(legacy_json)
+
+    def _conn(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.create_function("article_id", 1, article_id, deterministic=True)
+            self.local.conn = conn
+        return conn
+
+    def _migrate(self):
+        conn = self._conn()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for i, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            with conn:
+                conn.executescript(script)
+                conn.execute(f"PRAGMA user_version = {i}")
+            logging.info(f"Article store migrated to schema version {i}")
+
+    def _import_legacy_json(self, legacy_json):
+        if not legacy_json or not os.path.exists(legacy_json) or self.has_articles():
+            return
+        try:
+            with open(legacy_json, 'r') as f:
+                news_data = json.load(f)
+        except Exception as e:
+            logging.error(f"Failed to read legacy cache {legacy_json}: {e}")
+            return
+        self.add_all(news_data)
+        logging.info(f"Imported {len(news_data)} articles from {legacy_json} into {self.path}")
+
+    def _row_to_article(self, row):
+        return Article(id=row["id"], guid=row["guid"], feed=row["feed"], title=row["title"],
+                       summary=row["summary"], link=row["link"], image=row["image"],
+                       source_image=row["source_image"],
+                       image_variants=json.loads(row["image_variants"]) if row["image_variants"] else None,
+                       image_hash=row["image_hash"], store=self)
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def has_articles(self):
+        return self._conn().execute("SELECT 1 FROM articles LIMIT 1").fetchone() is not None
+
+    def exists(self, article_id):
+        return self._conn().execute("SELECT 1 FROM articles WHERE id = ?", (article_id,)).fetchone() is not None
+
+    def get(self, article_id):
+        row = self._conn().execute(f"SELECT {SUMMARY_COLUMNS} FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return self._row_to_article(row) if row else None
+
+    def get_fullstory(self, article_id):
+        row = self._conn().execute("SELECT fullstory FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return row[0] if row else None
+
+    def lookup(self, keys):
+        """{guid or link: (article, story_failed)} for stored articles matching any of keys, via the guid/link indexes.
+
+        story_failed is true when the stored story is a scrape-failure placeholder.
+        """
+        keys = list(set(keys))
+        if not keys:
+            return {}
+        marks = ", ".join("?" * len(keys))
+        rows = self._conn().execute(f"""
+            SELECT {SUMMARY_COLUMNS}, fullstory = ? OR substr(fullstory, 1, ?) = ? AS story_failed
+            FROM articles WHERE guid IN ({marks}) OR link IN ({marks})
+        """, (STORY_UNAVAILABLE, len(STORY_ERROR_PREFIX), STORY_ERROR_PREFIX, *keys, *keys)).fetchall()
+        found = {}
+        for row in rows:
+            match = (self._row_to_article(row), bool(row["story_failed"]))
+            found[row["guid"]] = match
+            found.setdefault(row["link"], match)
+        return found
+
+    def all(self):
+        """Every article in list order, without the story text (see Article.fullstory)."""
+        rows = self._conn().execute(f"SELECT {SUMMARY_COLUMNS} FROM articles ORDER BY position")
+        return [self._row_to_article(row) for row in rows]
+
+    def add_all(self, news_data):
+        """Insert news_data ahead of every stored article, in list order, without renumbering existing rows.
+
+        An article that is already stored only has its story (and feed metadata) replaced; its position and
+        processed image fields are kept. Articles whose story is not resident are skipped: their row is either
+        stored already or was evicted meanwhile, and re-inserting it would leave an article without a story.
+        """
+        if not news_data:
+            return
+        conn = self._conn()
+        first = conn.execute("SELECT MIN(position) FROM articles").fetchone()[0]
+        start = (first if first is not None else 0) - len(news_data)
+        now = time.time()
+        rows = []
+        for position, news in enumerate(news_data, start=start):
+            guid = news.get("guid") or news["link"]
+            fullstory = news.resident_fullstory if isinstance(news, Article) else news.get("fullstory")
+            if fullstory is None and isinstance(news, Article):
+                continue
+            rows.append((ensure_article_id(news), guid, position, news.get("feed"), news["title"], news.get("summary"),
+                         fullstory, news["link"], news.get("image"), news.get("source_image"),
+                         json.dumps(news.get("image_variants")) if news.get("image_variants") else None,
+                         news.get("image_hash"), now))
+        with conn:
+            conn.executemany("""
+                INSERT INTO articles (id, guid, position, feed, title, summary, fullstory, link, image, source_image,
+                                      image_variants, image_hash, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guid) DO UPDATE SET
+                    feed = excluded.feed, title = excluded.title, summary = excluded.summary,
+                    fullstory = COALESCE(excluded.fullstory, articles.fullstory), link = excluded.link
+            """, rows)
+        for news in news_data:
+            if isinstance(news, Article):
+                news.release_fullstory(self)
+
+    def eviction_candidates(self):
+        """Oldest first: (id, [image paths], source_image, fetched_at, stored text bytes)."""
+        rows = self._conn().execute("""
+            SELECT id, image, source_image, image_variants, fetched_at,
+                   COALESCE(LENGTH(CAST(fullstory AS BLOB)), 0) + COALESCE(LENGTH(CAST(summary AS BLOB)), 0) AS text_bytes
+            FROM articles ORDER BY fetched_at
+        """)
+        candidates = []
+        for row in rows:
+            images = [row["image"]] if row["image"] else []
+            if row["image_variants"]:
+                images.extend(path for path in json.loads(row["image_variants"]).values() if path not in images)
+            candidates.append((row["id"], images, row["source_image"], row["fetched_at"], row["text_bytes"]))
+        return candidates
+
+    def image_in_use(self, image):
+        # Near-duplicate sources share processed files, so a variant path may belong to another source's article
+        return self._conn().execute("SELECT 1 FROM articles WHERE image = ? OR instr(image_variants, ?) LIMIT 1",
+                                    (image, json.dumps(image))).fetchone() is not None
+
+    def source_in_use(self, source_image):
+        return self._conn().execute("SELECT 1 FROM articles WHERE source_image = ? LIMIT 1", (source_image,)).fetchone() is not None
+
+    def delete_many(self, article_ids):
+        conn = self._conn()
+        with conn:
+            conn.executemany("DELETE FROM articles WHERE id = ?", [(article_id,) for article_id in article_ids])
+
+    def update_image(self, article_id, image, source_image=None, image_variants=None, image_hash=None):
+        conn = self._conn()
+        with conn:
+            conn.execute("""
+                UPDATE articles SET image = ?, source_image = COALESCE(?, source_image), image_variants = ?,
+                                    image_hash = COALESCE(?, image_hash)
+                WHERE id = ?
+            """, (image, source_image, json.dumps(image_variants) if image_variants else None, image_hash, article_id))
+
+    def delete(self, article_id):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
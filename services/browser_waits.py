@@ -0,0 +1,55 @@
+import time
+import logging
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Per-step ceilings in seconds; each wait returns as soon as its condition holds
+STEP_TIMEOUTS = {
+    "page_ready": 30,
+    "login_form": 15,
+    "login_cookie": 20,
+    "captcha_widget": 10,
+    "captcha_cleared": 30,
+    "post_trigger": 20,
+    "post_box": 20,
+    "upload_input": 15,
+    "upload_thumbnail": 60,
+    "submit_enabled": 30,
+}
+POLL_SECONDS = 0.2
+
+
+def wait_for(driver, step, condition, timeout=None):
+    """WebDriverWait on condition, logging how long the step took; raises TimeoutException past its timeout."""
+    timeout = timeout or STEP_TIMEOUTS.get(step, 30)
+    start = time.monotonic()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_SECONDS).until(condition)
+    except TimeoutException:
+        logging.error(f"Browser step '{step}' timed out after {time.monotonic() - start:.1f}s")
+        raise
+    logging.info(f"Browser step '{step}' ready in {time.monotonic() - start:.2f}s")
+    return result
+
+
+def page_ready(driver):
+    return driver.execute_script("return document.readyState") in ("interactive", "complete")
+
+
+def cookie_present(name):
+    return lambda driver: driver.get_cookie(name) is not None
+
+
+def more_elements(locator, before):
+    """Condition: more elements match locator than the `before` count taken earlier."""
+    return lambda driver: len(driver.find_elements(*locator)) > before
+
+
+def enabled_and_clickable(locator):
+    def condition(driver):
+        elements = driver.find_elements(*locator)
+        if elements and elements[0].is_displayed() and elements[0].is_enabled() \
+                and elements[0].get_attribute("disabled") is None:
+            return elements[0]
+        return False
+    return condition
@@ -0,0 +1,70 @@
+import os
+import time
+import logging
+from services.image_cache import ImageCache
+
+
+class CacheManager:
+    """Evicts articles (and their processed images) by age, then oldest-first until count and size limits hold."""
+
+    def __init__(self, store, output_dir, max_age_days=7, max_articles=500, max_bytes=200 * 1024 * 1024,
+                 logo_url=None):
+        self.store = store
+        self.image_cache = ImageCache(output_dir)
+        self.logo_path = os.path.abspath(logo_url) if logo_url else None
+        self.max_age_days = max_age_days
+        self.max_articles = max_articles
+        self.max_bytes = max_bytes
+
+    def _owned_image(self, image):
+        # Only files the image cache named are deleted; source files and the logo fallback are left alone
+        if not image or not os.path.isfile(image):
+            return None
+        path = os.path.abspath(image)
+        if path == self.logo_path or not self.image_cache.owns(path):
+            return None
+        return path
+
+    def evict(self, protected_ids=()):
+        protected_ids = set(protected_ids)
+        candidates = []
+        total_bytes = 0
+        for article_id, images, source_image, fetched_at, text_bytes in self.store.eviction_candidates():
+            owned = []
+            for image in images:
+                image_path = self._owned_image(image)
+                if image_path:
+                    owned.append((image, image_path))
+            size = text_bytes + sum(os.path.getsize(image_path) for _, image_path in owned)
+            total_bytes += size
+            candidates.append((article_id, owned, source_image, fetched_at, size))
+
+        cutoff = time.time() - self.max_age_days * 86400
+        remaining = len(candidates)
+        evicted = []
+        evicted_images = []
+        for article_id, owned, source_image, fetched_at, size in candidates:
+            if article_id in protected_ids:
+                continue
+            expired = self.max_age_days and fetched_at < cutoff
+            over_count = self.max_articles and remaining > self.max_articles
+            over_bytes = self.max_bytes and total_bytes > self.max_bytes
+            if not (expired or over_count or over_bytes):
+                break
+            evicted.append(article_id)
+            remaining -= 1
+            total_bytes -= size
+            evicted_images.extend((source_image, image, image_path) for image, image_path in owned)
+
+        if evicted:
+            self.store.delete_many(evicted)
+            # Processed images are content-addressed and may be shared with articles we kept
+            for source_image, image, image_path in set(evicted_images):
+                if (source_image and self.store.source_in_use(source_image)) or self.store.image_in_use(image):
+                    continue
+                try:
+                    os.remove(image_path)
+                except Exception as e:
+                    logging.error(f"Failed to delete image {image_path}: {e}")
+            logging.info(f"Evicted {len(evicted)} cached articles; {remaining} remain ({total_bytes // 1024} KB)")
+        return evicted
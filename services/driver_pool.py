@@ -0,0 +1,182 @@
+import threading
+import time
+import logging
+from contextlib import contextmanager
+import undetected_chromedriver as uc
+from services.resource_policy import apply_policy
+
+PAGE_LOAD_TIMEOUT = 60
+
+# undetected_chromedriver patches the chromedriver binary on every launch; two launches at once
+# race on the same file (WinError 183 on Windows), so only one uc.Chrome() runs at a time.
+_patch_lock = threading.Lock()
+
+
+class PooledDriver:
+    def __init__(self, driver, slot):
+        self.driver = driver
+        self.slot = slot
+        self.created = time.monotonic()
+        self.uses = 0
+
+
+class DriverPool:
+    """Process-wide pool of warm, logged-in Chrome drivers handed out to posting and scheduling threads."""
+
+    def __init__(self, session, login, size=2, headless=True, max_uses=50, max_age_seconds=3600, block_policy=None):
+        self.session = session
+        self.login = login
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self.block_policy = block_policy
+        self._cond = threading.Condition()
+        self._idle = []
+        self._free_slots = [f"driver-{n}" for n in range(size)]
+        self._busy = {}  # id(driver) -> PooledDriver
+        self._closed = False
+
+    def _options(self, slot):
+        options = uc.ChromeOptions()
+        # Hand control back at DOMContentLoaded; the composer never needs the page's late subresources
+        options.page_load_strategy = "eager"
+        options.add_argument("--start-maximized")
+        if self.headless:
+            options.add_argument("--headless")
+            options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        return self.session.apply_profile(options, slot)
+
+    def _launch(self, slot):
+        started = time.monotonic()
+        with _patch_lock:
+            driver = uc.Chrome(options=self._options(slot))
+        try:
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            apply_policy(driver, self.block_policy)
+            if not self.session.ensure_logged_in(driver, self.login):
+                logging.warning(f"Quora login could not be confirmed for {slot}")
+        except Exception:
+            self._quit(driver)
+            raise
+        logging.info(f"Launched {slot} in {time.monotonic() - started:.1f}s")
+        return PooledDriver(driver, slot)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.error(f"Failed to close ChromeDriver: {e}")
+
+    def _healthy(self, pooled):
+        if pooled.uses >= self.max_uses or time.monotonic() - pooled.created > self.max_age_seconds:
+            logging.info(f"Recycling {pooled.slot} after {pooled.uses} uses")
+            return False
+        try:
+            pooled.driver.execute_script("return 1")
+            return True
+        except Exception as e:
+            logging.warning(f"{pooled.slot} failed its health check: {e}")
+            return False
+
+    def _retire(self, pooled):
+        self._quit(pooled.driver)
+        with self._cond:
+            self._free_slots.append(pooled.slot)
+            self._cond.notify()
+
+    def _launch_into_pool(self, slot):
+        try:
+            pooled = self._launch(slot)
+        except Exception as e:
+            logging.error(f"Failed to launch {slot}: {e}")
+            with self._cond:
+                self._free_slots.append(slot)
+                self._cond.notify()
+            return
+        with self._cond:
+            if self._closed:
+                self._quit(pooled.driver)
+                return
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def warm(self, count=None):
+        """Launch up to count idle drivers (default: the whole pool) in the background."""
+        with self._cond:
+            count = min(count or self.size, len(self._free_slots))
+            slots = [self._free_slots.pop() for _ in range(count)]
+        for slot in slots:
+            threading.Thread(target=self._launch_into_pool, args=(slot,), daemon=True).start()
+
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle and not self._free_slots:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is shut down")
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No ChromeDriver available")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("Driver pool is shut down")
+                pooled = self._idle.pop() if self._idle else None
+                slot = None if pooled else self._free_slots.pop()
+            if pooled is None:
+                try:
+                    pooled = self._launch(slot)
+                except Exception:
+                    with self._cond:
+                        self._free_slots.append(slot)
+                        self._cond.notify()
+                    raise
+            elif not self._healthy(pooled):
+                self._retire(pooled)
+                continue
+            pooled.uses += 1
+            with self._cond:
+                self._busy[id(pooled.driver)] = pooled
+            return pooled.driver
+
+    def release(self, driver, healthy=True):
+        with self._cond:
+            pooled = self._busy.pop(id(driver), None)
+            if pooled is not None and healthy and not self._closed:
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+        if pooled is None:
+            self._quit(driver)
+        else:
+            self._retire(pooled)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        driver = self.acquire(timeout)
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = self._healthy_after_error(driver)
+            raise
+        finally:
+            self.release(driver, healthy)
+
+    def _healthy_after_error(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled.driver)
@@ -0,0 +1,93 @@
+from urllib.parse import urlparse
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+import logging
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# Per-site body container and the classes whose paragraphs are never part of the story
+SITE_RULES = {
+    "nypost.com": {
+        "container": ("div", "entry-content"),
+        "exclude": ("inline-module", "related-stories", "newsletter-signup", "ad-unit", "social-share",
+                    "wp-caption-text", "credit"),
+        "min_length": 50
+    }
+}
+DEFAULT_RULE = {"container": None, "exclude": (), "min_length": 50}
+
+
+def rule_for(url):
+    host = urlparse(url).netloc.lower()
+    for domain, rule in SITE_RULES.items():
+        if host == domain or host.endswith("." + domain):
+            return rule
+    return DEFAULT_RULE
+
+
+def _class_test(class_name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class ArticleExtractor:
+    """Extracts story paragraphs from an article page, parsing only the site's body container when one is known."""
+
+    def __init__(self, backend=None):
+        if backend is None:
+            backend = "lxml" if lxml is not None else "bs4"
+        if backend == "lxml" and lxml is None:
+            logging.warning("lxml is not installed, falling back to the bs4 extractor backend")
+            backend = "bs4"
+        self.backend = backend
+
+    def extract(self, html, url):
+        rule = rule_for(url)
+        if self.backend == "lxml":
+            paragraphs = self._paragraphs_lxml(html, rule)
+        else:
+            paragraphs = self._paragraphs_bs4(html, rule)
+        min_length = rule["min_length"]
+        return "\n".join([text for text in paragraphs if len(text) > min_length])
+
+    def _paragraphs_lxml(self, html, rule):
+        document = lxml.html.fromstring(html)
+        roots = [document]
+        if rule["container"]:
+            tag, class_name = rule["container"]
+            roots = document.xpath(f"//{tag}[{_class_test(class_name)}]")[:1] or roots
+        texts = []
+        for root in roots:
+            for class_name in rule["exclude"]:
+                for element in root.xpath(f".//*[{_class_test(class_name)}]"):
+                    element.drop_tree()
+            texts.extend(p.text_content() for p in root.iter("p"))
+        return texts
+
+    def _paragraphs_bs4(self, html, rule):
+        soup = None
+        if rule["container"]:
+            tag, class_name = rule["container"]
+            # The strainer sees the raw class attribute, so match the token inside it
+            class_pattern = re.compile(rf"(^|\s){re.escape(class_name)}(\s|$)")
+            soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer(tag, class_=class_pattern))
+            if not soup.contents:
+                soup = None
+        if soup is None:
+            soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("p"))
+        for class_name in rule["exclude"]:
+            for element in soup.find_all(class_=class_name):
+                element.decompose()
+        return [p.get_text() for p in soup.find_all("p")]
+
+
+_default_extractor = None
+
+
+def extract_story(html, url):
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = ArticleExtractor()
+    return _default_extractor.extract(html, url)
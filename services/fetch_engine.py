@@ -0,0 +1,36 @@
+import asyncio
+import concurrent.futures
+from urllib.parse import urlparse
+
+
+class AsyncFetchEngine:
+    """Runs blocking fetch calls on an asyncio loop with a global and a per-host connection cap."""
+
+    def __init__(self, max_connections=16, max_per_host=4, connect_timeout=5, read_timeout=30):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = (connect_timeout, read_timeout)
+        self.executor = None
+        self.global_semaphore = None
+        self.host_semaphores = {}
+
+    def run(self, coro_fn, *args):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+            self.executor = executor
+            try:
+                return asyncio.run(self._main(coro_fn, *args))
+            finally:
+                self.executor = None
+                self.host_semaphores = {}
+
+    async def _main(self, coro_fn, *args):
+        self.global_semaphore = asyncio.Semaphore(self.max_connections)
+        return await coro_fn(*args)
+
+    async def call(self, url, func, *args):
+        host = urlparse(url).netloc
+        host_semaphore = self.host_semaphores.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with host_semaphore:
+            async with self.global_semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, func, *args)
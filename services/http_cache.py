@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import threading
+import logging
+from services.http_session import get_session, DEFAULT_TIMEOUT
+
+
+class HttpCache:
+    """On-disk conditional-GET cache keyed by URL (ETag / Last-Modified), for the handful of feed URLs we poll."""
+
+    def __init__(self, cache_dir="http_cache"):
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.lock = threading.Lock()
+        self.index = {}
+        self.hits = 0
+        self.misses = 0
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    # Older indexes also held validators and story copies for every article page; drop those
+                    self.index = {url: entry for url, entry in json.load(f).items() if entry.get("body")}
+            except Exception as e:
+                logging.warning(f"Discarding unreadable HTTP cache index {self.index_file}: {e}")
+
+    def _body_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".body")
+
+    def _read_body(self, url):
+        path = self._body_path(url)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding="utf-8") as f:
+            return f.read()
+
+    def _write_body(self, url, text):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._body_path(url), 'w', encoding="utf-8") as f:
+            f.write(text)
+
+    def fetch(self, url, headers=None, timeout=DEFAULT_TIMEOUT, conditional=True):
+        """Return (text, not_modified). On a 304 text is the cached body."""
+        request_headers = dict(headers or {})
+        with self.lock:
+            entry = self.index.get(url) if conditional else None
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = get_session().get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry:
+            body = self._read_body(url)
+            if body is not None:
+                self.hits += 1
+                return body, True
+            return self.fetch(url, headers, timeout, conditional=False)
+
+        response.raise_for_status()
+        self.misses += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self.lock:
+            if etag or last_modified:
+                self.index[url] = {"etag": etag, "last_modified": last_modified, "body": True}
+            else:
+                self.index.pop(url, None)
+        if etag or last_modified:
+            self._write_body(url, response.text)
+        return response.text, False
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self.lock:
+            data = json.dumps(self.index)
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(data)
+        os.replace(tmp_file, self.index_file)
+        logging.info(f"HTTP cache saved: {self.hits} not-modified, {self.misses} full downloads")
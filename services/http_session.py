@@ -0,0 +1,68 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0"
+DEFAULT_TIMEOUT = (5, 30)
+
+_lock = threading.Lock()
+_local = threading.local()
+_adapter = None
+
+
+def configure_session(pool_size=16, retries=3, backoff_factor=0.5):
+    """Size the shared keep-alive pool. Call once at startup, before any worker fetches."""
+    global _adapter
+    retry = Retry(total=retries, backoff_factor=backoff_factor,
+                  status_forcelist=(500, 502, 503, 504), allowed_methods=("GET", "HEAD"))
+    with _lock:
+        old_adapter = _adapter
+        _adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size, max_retries=retry)
+    if old_adapter is not None:
+        old_adapter.close()
+
+
+def _get_adapter():
+    if _adapter is None:
+        configure_session()
+    return _adapter
+
+
+def get_session():
+    """Per-thread Session sharing one connection pool, so cookies and headers never race across workers."""
+    adapter = _get_adapter()
+    session = getattr(_local, "session", None)
+    if session is None or session.get_adapter("https://") is not adapter:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session = session
+    return session
+
+
+def pool_stats():
+    adapter = _get_adapter()
+    pools = adapter.poolmanager.pools
+    total_requests = 0
+    total_connections = 0
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        total_requests += pool.num_requests
+        total_connections += pool.num_connections
+    reused = max(0, total_requests - total_connections)
+    return {
+        "requests": total_requests,
+        "connections": total_connections,
+        "handshakes_avoided": reused,
+        "reuse_ratio": reused / total_requests if total_requests else 0.0
+    }
+
+
+def format_pool_stats():
+    stats = pool_stats()
+    return (f"HTTP pool: {stats['requests']} requests over {stats['connections']} connections, "
+            f"{stats['handshakes_avoided']} handshakes avoided ({stats['reuse_ratio']:.0%} reuse)")
@@ -0,0 +1,42 @@
+import hashlib
+import json
+import os
+import re
+
+KEY_LENGTH = 32
+_CACHE_NAME = re.compile(rf"[0-9a-f]{{{KEY_LENGTH}}}\.[a-z0-9]+")
+
+
+def logo_identity(logo_url):
+    if logo_url and os.path.isfile(logo_url):
+        stat = os.stat(logo_url)
+        return [os.path.abspath(logo_url), stat.st_mtime_ns, stat.st_size]
+    return [logo_url]
+
+
+class ImageCache:
+    """Content-addressed store for processed images: the file name is a hash of the source URL and processing parameters."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def key(self, source, logo_url, max_size, margin, profile):
+        params = json.dumps([source, logo_identity(logo_url), max_size, margin, profile], sort_keys=True)
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()[:KEY_LENGTH]
+
+    def path_for(self, source, logo_url, max_size, margin, profile):
+        fmt = profile.get("format", "PNG").upper()
+        extension = "jpg" if fmt == "JPEG" else fmt.lower()
+        return os.path.join(self.cache_dir, f"{self.key(source, logo_url, max_size, margin, profile)}.{extension}")
+
+    def owns(self, path):
+        """True only for files path_for could have named, directly inside the cache directory."""
+        path = os.path.abspath(path)
+        return (os.path.dirname(path) == os.path.abspath(self.cache_dir)
+                and _CACHE_NAME.fullmatch(os.path.basename(path)) is not None)
+
+    def lookup(self, source, logo_url, max_size, margin, profiles):
+        """Return ({name: (path, profile)} for every profile, hit) where hit means all of them already exist."""
+        outputs = {name: (self.path_for(source, logo_url, max_size, margin, profile), profile)
+                   for name, profile in profiles.items()}
+        return outputs, all(os.path.isfile(path) for path, _ in outputs.values())
@@ -0,0 +1,288 @@
+import concurrent.futures
+import os
+import shutil
+import logging
+from io import BytesIO
+from PIL import Image
+from services.http_session import get_session, DEFAULT_TIMEOUT
+from services.logo_cache import LogoOverlayCache
+from services.phash import dhash, find_match
+
+MAX_SIZE = 1024
+MAX_DOWNLOAD_BYTES = 20 * 1024 * 1024
+MIN_QUALITY = 40
+DEFAULT_PROFILES = {
+    "x": {"format": "JPEG", "quality": 85, "max_bytes": 5 * 1024 * 1024},
+    "quora": {"format": "JPEG", "quality": 80, "max_bytes": 2 * 1024 * 1024}
+}
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+
+def fetch_image_bytes(url_or_path, max_bytes=MAX_DOWNLOAD_BYTES):
+    if os.path.isfile(url_or_path):
+        try:
+            if os.path.getsize(url_or_path) > max_bytes:
+                logging.error(f"Skipping local image larger than {max_bytes} bytes: {url_or_path}")
+                return None
+            with open(url_or_path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            logging.error(f"Failed to load local image from {url_or_path}: {e}")
+            return None
+    try:
+        with get_session().get(url_or_path, timeout=DEFAULT_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                logging.error(f"Failed to download image from {url_or_path}: HTTP {response.status_code}")
+                return None
+            if int(response.headers.get("Content-Length") or 0) > max_bytes:
+                logging.error(f"Image at {url_or_path} exceeds {max_bytes} bytes, skipping")
+                return None
+            buffer = BytesIO()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+                if buffer.tell() > max_bytes:
+                    logging.error(f"Image at {url_or_path} exceeds {max_bytes} bytes, aborting download")
+                    return None
+            return buffer.getvalue()
+    except Exception as e:
+        logging.error(f"Failed to download image from {url_or_path}: {e}")
+        return None
+
+
+def fit_size(width, height, max_size=MAX_SIZE):
+    aspect_ratio = width / height
+    if width > height:
+        new_width = min(width, max_size)
+        new_height = int(new_width / aspect_ratio)
+    else:
+        new_height = min(height, max_size)
+        new_width = int(new_height * aspect_ratio)
+    return max(1, new_width), max(1, new_height)
+
+
+def decode_image(data, source=""):
+    if data is None:
+        return None
+    try:
+        return Image.open(BytesIO(data)).convert("RGBA")
+    except Exception as e:
+        logging.error(f"Failed to decode image from {source}: {e}")
+        return None
+
+
+def decode_fitted(data, source="", max_size=MAX_SIZE):
+    """Decode to RGBA fitted within max_size. JPEGs are decoded at a reduced DCT scale that still covers the fit;
+    the target size comes from the original dimensions, so the result matches a full decode's."""
+    if data is None:
+        return None
+    try:
+        image = Image.open(BytesIO(data))
+        size = fit_size(image.width, image.height, max_size)
+        if image.format == "JPEG":
+            image.draft("RGB", size)
+        return resize_to_fit(image.convert("RGBA"), max_size, size)
+    except Exception as e:
+        logging.error(f"Failed to decode image from {source}: {e}")
+        return None
+
+
+def resize_to_fit(image, max_size=MAX_SIZE, size=None):
+    new_width, new_height = size or fit_size(image.width, image.height, max_size)
+    # Cheap integer box reduce down to ~2x the target, then LANCZOS for the final resample
+    factor = min(image.width // new_width, image.height // new_height) // 2
+    if factor >= 2:
+        image = image.reduce(factor)
+    return image.resize((new_width, new_height), Image.LANCZOS)
+
+
+def load_image(url_or_path):
+    return decode_image(fetch_image_bytes(url_or_path), url_or_path)
+
+
+def compose_with_logo(image, logo_url, logo_cache, margin=20, max_size=MAX_SIZE):
+    """Fit image within max_size and paste the cached logo overlay in the bottom-right corner."""
+    if image is None:
+        image = Image.new("RGBA", (300, 200), (255, 255, 255, 0))
+
+    image = resize_to_fit(image, max_size)
+
+    logo = logo_cache.get(logo_url, image.width // 7, radius=20)
+    if logo is None:
+        return image
+    logo_width, logo_height = logo.size
+
+    x_pos = image.width - logo_width - margin
+    y_pos = image.height - logo_height - margin
+    try:
+        image.paste(logo, (x_pos, y_pos), logo)
+        return image
+    except Exception as e:
+        logging.error(f"Failed to paste logo onto image: {e}")
+        return image
+
+
+def _encode(image, fmt, quality):
+    buffer = BytesIO()
+    if fmt == "PNG":
+        image.save(buffer, format=fmt, optimize=True)
+    else:
+        image.save(buffer, format=fmt, quality=quality)
+    return buffer.getvalue()
+
+
+def encode_image(image, profile):
+    """Encode to the profile's format; lossy formats binary-search quality down until max_bytes fits."""
+    fmt = profile.get("format", "PNG").upper()
+    quality = profile.get("quality", 85)
+    max_bytes = profile.get("max_bytes")
+    if fmt == "JPEG" and image.mode != "RGB":
+        # JPEG has no alpha: flatten onto white rather than letting transparent areas go black
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A") if image.mode == "RGBA" else None)
+        image = background
+    data = _encode(image, fmt, quality)
+    if fmt == "PNG" or not max_bytes or len(data) <= max_bytes:
+        return data
+
+    low, high = MIN_QUALITY, quality - 1
+    best = None
+    while low <= high:
+        mid = (low + high) // 2
+        candidate = _encode(image, fmt, mid)
+        if len(candidate) <= max_bytes:
+            best = candidate
+            low = mid + 1
+        else:
+            high = mid - 1
+    if best is None:
+        logging.warning(f"Could not fit {fmt} under {max_bytes} bytes even at quality {MIN_QUALITY}")
+        return _encode(image, fmt, MIN_QUALITY)
+    return best
+
+
+def fetch_and_hash(source):
+    data = fetch_image_bytes(source)
+    return data, dhash(data) if data else None
+
+
+def link_outputs(written, outputs):
+    """Give a near-duplicate job its own cache paths for written {name: path}, hard-linked where the filesystem allows."""
+    linked = {}
+    for name, path in written.items():
+        target = outputs[name][0]
+        try:
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copyfile(path, target)
+            linked[name] = target
+        except Exception as e:
+            logging.error(f"Failed to link {path} to {target}: {e}")
+    return linked
+
+
+# One overlay cache per worker process, so each process decodes and resizes the logo once
+_worker_logo_cache = None
+
+
+def _init_worker(log_file):
+    if log_file:
+        logging.basicConfig(filename=log_file, level=logging.INFO, format=LOG_FORMAT)
+
+
+def process_image(image_bytes, source, logo_url, outputs, margin=20, max_size=MAX_SIZE):
+    """Process-pool entry point: decode, resize and composite once, then encode every {name: (path, profile)} output.
+
+    Returns {name: path} for the outputs that were written. Nothing is written when the source could not be
+    downloaded or decoded, so the content-addressed paths stay free and the next run retries it.
+    """
+    global _worker_logo_cache
+    if _worker_logo_cache is None:
+        _worker_logo_cache = LogoOverlayCache(load_image)
+    try:
+        image = decode_fitted(image_bytes, source, max_size)
+        if image is None:
+            return {}
+        image = compose_with_logo(image, logo_url, _worker_logo_cache, margin, max_size)
+    except Exception as e:
+        logging.error(f"Failed to process image from {source}: {e}")
+        return {}
+    written = {}
+    for name, (output_path, profile) in outputs.items():
+        try:
+            data = encode_image(image, profile)
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            written[name] = output_path
+        except Exception as e:
+            logging.error(f"Failed to encode {name} image from {source}: {e}")
+    return written
+
+
+class ImagePipeline:
+    """Downloads on a thread pool, composites and encodes on a process pool sized to the cores."""
+
+    def __init__(self, io_workers=8, cpu_workers=None, log_file=None):
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.log_file = log_file
+        self.process_pool = None
+
+    def _get_process_pool(self):
+        if self.process_pool is None:
+            self.process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.cpu_workers, initializer=_init_worker, initargs=(self.log_file,))
+        return self.process_pool
+
+    def run(self, jobs, logo_url, margin=20, progress=None, on_result=None):
+        """jobs is a list of (source, {name: (output_path, profile)}).
+
+        Returns (results, hashes, duplicate_of) in job order: {name: path} dicts, perceptual hashes, and for
+        near-identical sources the index of the job whose output they reuse (None otherwise). Reused outputs are
+        linked under the duplicate's own paths, so its next lookup is a cache hit too.
+        on_result(index, outputs) is called as each job finishes, so consumers need not wait for the batch.
+        """
+        results = [{} for _ in jobs]
+        hashes = [None] * len(jobs)
+        duplicate_of = [None] * len(jobs)
+        if not jobs:
+            return results, hashes, duplicate_of
+        process_pool = self._get_process_pool()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.io_workers) as io_pool:
+            downloads = {io_pool.submit(fetch_and_hash, source): i for i, (source, _) in enumerate(jobs)}
+            composites = {}
+            representatives = []
+            for future in concurrent.futures.as_completed(downloads):
+                i = downloads[future]
+                data, hashes[i] = future.result()
+                if hashes[i]:
+                    duplicate_of[i] = find_match(hashes[i], representatives)
+                    if duplicate_of[i] is not None:
+                        continue
+                    representatives.append((i, hashes[i]))
+                source, outputs = jobs[i]
+                composites[process_pool.submit(process_image, data, source, logo_url, outputs, margin)] = i
+
+            done = len(jobs) - len(composites)
+            for future in concurrent.futures.as_completed(composites):
+                i = composites[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logging.error(f"Image worker failed for {jobs[i][0]}: {e}")
+                finished = [i] + [j for j, original in enumerate(duplicate_of) if original == i]
+                for j in finished[1:]:
+                    results[j] = link_outputs(results[i], jobs[j][1])
+                if on_result:
+                    for j in finished:
+                        on_result(j, results[j])
+                done += 1
+                if progress:
+                    progress(done, len(jobs))
+
+        return results, hashes, duplicate_of
+
+    def shutdown(self):
+        if self.process_pool is not None:
+            self.process_pool.shutdown(cancel_futures=True)
+            self.process_pool = None
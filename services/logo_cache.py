@@ -0,0 +1,65 @@
+import os
+import threading
+import logging
+from PIL import Image, ImageDraw
+
+
+def round_corners(im, radius):
+    if im is None:
+        return None
+    rounded_mask = Image.new("L", im.size, 0)
+    draw = ImageDraw.Draw(rounded_mask)
+    draw.rounded_rectangle([(0, 0), im.size], radius=radius, fill=255)
+    im.putalpha(rounded_mask)
+    return im
+
+
+class LogoOverlayCache:
+    """Memoizes the decoded logo and its resized, rounded overlay per (source, width, radius).
+
+    Local files are re-read when their mtime or size changes; a different URL is a different key.
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.sources = {}
+        self.overlays = {}
+
+    def _source_version(self, logo_url):
+        if os.path.isfile(logo_url):
+            stat = os.stat(logo_url)
+            return (stat.st_mtime_ns, stat.st_size)
+        return None
+
+    def _source(self, logo_url):
+        version = self._source_version(logo_url)
+        with self.lock:
+            cached = self.sources.get(logo_url)
+            if cached is not None and cached[0] == version:
+                return version, cached[1]
+        logo = self.loader(logo_url)
+        if logo is None:
+            return version, None
+        with self.lock:
+            if logo_url in self.sources:
+                logging.info(f"Logo changed, rebuilding overlays: {logo_url}")
+            self.sources[logo_url] = (version, logo)
+            self.overlays = {key: overlay for key, overlay in self.overlays.items() if key[0] != logo_url}
+        return version, logo
+
+    def get(self, logo_url, width, radius=20):
+        """Ready-to-paste RGBA logo (its alpha channel is the mask), or None if the logo can't be loaded."""
+        version, source = self._source(logo_url)
+        if source is None:
+            return None
+        key = (logo_url, version, width, radius)
+        with self.lock:
+            overlay = self.overlays.get(key)
+        if overlay is not None:
+            return overlay
+        height = int(source.height * (width / source.width))
+        overlay = round_corners(source.resize((width, height), Image.LANCZOS), radius)
+        with self.lock:
+            self.overlays[key] = overlay
+        return overlay
@@ -0,0 +1,56 @@
+from io import BytesIO
+from PIL import Image
+import logging
+
+HASH_THRESHOLD = 6  # max differing bits (of 64) for two images to count as the same photo
+
+
+def dhash(data):
+    """64-bit difference hash of encoded image bytes, as 16 hex chars (None if undecodable)."""
+    try:
+        image = Image.open(BytesIO(data))
+        image.draft("L", (64, 64))
+        pixels = list(image.convert("L").resize((9, 8), Image.LANCZOS).getdata())
+    except Exception as e:
+        logging.warning(f"Could not hash image: {e}")
+        return None
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return f"{bits:016x}"
+
+
+def hamming(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def find_match(image_hash, known, threshold=HASH_THRESHOLD):
+    """Return the key of the first (key, hash) in known within threshold of image_hash."""
+    for key, other_hash in known:
+        if hamming(image_hash, other_hash) <= threshold:
+            return key
+    return None
+
+
+def duplicate_groups(items, threshold=HASH_THRESHOLD):
+    """Map key -> group number (from 1) for every (key, hash) that shares its image with another item."""
+    representatives = []
+    members = {}
+    for key, image_hash in items:
+        if not image_hash:
+            continue
+        match = find_match(image_hash, representatives, threshold)
+        if match is None:
+            representatives.append((key, image_hash))
+            match = key
+        members.setdefault(match, []).append(key)
+    groups = {}
+    group_number = 0
+    for keys in members.values():
+        if len(keys) < 2:
+            continue
+        group_number += 1
+        for key in keys:
+            groups[key] = group_number
+    return groups
@@ -0,0 +1,78 @@
+import json
+import os
+import time
+import logging
+from selenium.webdriver.common.by import By
+from services.browser_waits import wait_for, page_ready
+from services.resource_policy import navigate
+
+QUORA_URL = "https://www.quora.com/"
+QUORA_LOGIN_COOKIE = "m-b"  # set by Quora once the session is authenticated
+COOKIE_FILE = "quora_cookies.json"
+PROFILE_DIR = "chrome_profile"
+
+
+class QuoraSession:
+    """Keeps Quora logged in across runs: a Chrome user-data profile per slot plus a shared cookie jar."""
+
+    def __init__(self, profile_dir=PROFILE_DIR, cookie_file=COOKIE_FILE):
+        self.profile_dir = profile_dir
+        self.cookie_file = cookie_file
+
+    def apply_profile(self, options, slot):
+        # Chrome locks a user-data dir, so each concurrently running driver gets its own slot
+        if self.profile_dir:
+            options.add_argument(f"--user-data-dir={os.path.abspath(os.path.join(self.profile_dir, slot))}")
+        return options
+
+    def is_logged_in(self, driver):
+        return driver.get_cookie(QUORA_LOGIN_COOKIE) is not None and not driver.find_elements(By.NAME, "email")
+
+    def save_cookies(self, driver):
+        try:
+            with open(self.cookie_file, 'w') as f:
+                json.dump(driver.get_cookies(), f)
+        except Exception as e:
+            logging.error(f"Failed to save Quora cookies: {e}")
+
+    def load_cookies(self, driver):
+        if not os.path.exists(self.cookie_file):
+            return False
+        try:
+            with open(self.cookie_file, 'r') as f:
+                cookies = json.load(f)
+        except Exception as e:
+            logging.error(f"Failed to read Quora cookies: {e}")
+            return False
+        now = time.time()
+        loaded = 0
+        for cookie in cookies:
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            try:
+                driver.add_cookie(cookie)
+                loaded += 1
+            except Exception as e:
+                logging.debug(f"Skipping cookie {cookie.get('name')}: {e}")
+        return loaded > 0
+
+    def ensure_logged_in(self, driver, login):
+        """Open Quora and reuse the profile or cookie jar session; call login(driver) only when both have expired."""
+        navigate(driver, QUORA_URL)
+        if self.is_logged_in(driver):
+            logging.info("Reusing Quora session from browser profile")
+            self.save_cookies(driver)
+            return True
+        if self.load_cookies(driver):
+            driver.refresh()
+            wait_for(driver, "page_ready", page_ready)
+            if self.is_logged_in(driver):
+                logging.info("Restored Quora session from cookie jar")
+                return True
+        logging.info("Quora session expired; logging in")
+        if login(driver):
+            self.save_cookies(driver)
+            return True
+        return False
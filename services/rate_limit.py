@@ -0,0 +1,115 @@
+import math
+import threading
+import time
+import logging
+
+DEFAULT_WINDOW_SECONDS = 15 * 60
+DEFAULT_RETRY_SECONDS = 15 * 60  # when a 429 carries no reset header
+
+
+class RateLimitCancelled(Exception):
+    """Raised from acquire() once the limiter is cancelled (e.g. the app is closing)."""
+
+
+class TokenBucket:
+    """One X rate-limit window: refills to `limit` at `reset`, as reported by the x-rate-limit-* headers."""
+
+    def __init__(self, window=DEFAULT_WINDOW_SECONDS):
+        self.window = window
+        self.limit = None
+        self.remaining = None  # unknown until the first response
+        self.reset = 0.0
+
+    def refill(self, now):
+        if self.reset and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = now + self.window if self.limit is not None else 0.0
+
+    def available(self, now):
+        self.refill(now)
+        return self.remaining is None or self.remaining > 0
+
+
+class RateLimiter:
+    """Per-endpoint token buckets fed from X rate-limit headers; callers block until their window has room."""
+
+    def __init__(self, windows=None):
+        self.windows = windows or {}
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Wake every caller waiting for a window; they raise RateLimitCancelled."""
+        self._cancelled.set()
+
+    def _bucket(self, endpoint):
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            bucket = self._buckets[endpoint] = TokenBucket(self.windows.get(endpoint, DEFAULT_WINDOW_SECONDS))
+        return bucket
+
+    def acquire(self, endpoint, on_wait=None):
+        """Take a token, sleeping until the window resets if none are left. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            if self._cancelled.is_set():
+                raise RateLimitCancelled(f"Rate-limited {endpoint} call cancelled")
+            with self._lock:
+                bucket = self._bucket(endpoint)
+                now = time.time()
+                if bucket.available(now):
+                    if bucket.remaining is not None:
+                        bucket.remaining -= 1
+                    return waited
+                delay = max(1.0, bucket.reset - now)
+            logging.info(f"X rate limit for {endpoint} exhausted; waiting {delay:.0f}s")
+            if on_wait:
+                on_wait(endpoint, now + delay)
+            self._cancelled.wait(delay)
+            waited += delay
+
+    def update(self, endpoint, headers):
+        """Record x-rate-limit-limit/remaining/reset from a response."""
+        if not headers:
+            return
+        try:
+            limit = headers.get("x-rate-limit-limit")
+            remaining = headers.get("x-rate-limit-remaining")
+            reset = headers.get("x-rate-limit-reset")
+        except AttributeError:
+            return
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            if limit is not None:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                bucket.remaining = int(remaining)
+            if reset is not None:
+                bucket.reset = float(reset)
+                if bucket.limit is not None:
+                    bucket.window = max(bucket.window, bucket.reset - time.time())
+
+    def exhausted(self, endpoint, headers=None):
+        """A 429 came back: empty the bucket until the reported (or default) reset."""
+        self.update(endpoint, headers)
+        with self._lock:
+            bucket = self._bucket(endpoint)
+            bucket.remaining = 0
+            if bucket.reset <= time.time():
+                bucket.reset = time.time() + DEFAULT_RETRY_SECONDS
+
+    def projected_finish(self, pending):
+        """Epoch time by which {endpoint: calls still to make} fit in the known windows."""
+        now = time.time()
+        finish = now
+        with self._lock:
+            for endpoint, count in pending.items():
+                bucket = self._bucket(endpoint)
+                bucket.refill(now)
+                if bucket.remaining is None or count <= bucket.remaining:
+                    continue
+                per_window = max(1, bucket.limit or 1)
+                windows = math.ceil((count - bucket.remaining) / per_window)
+                finish = max(finish, max(bucket.reset, now) + (windows - 1) * bucket.window)
+        return finish
@@ -0,0 +1,64 @@
+import time
+import logging
+from services.browser_waits import wait_for, page_ready
+
+# URL patterns per category the composer can do without. DevTools wildcards must match the whole URL,
+# so extension patterns end in "*" to also catch query strings (font.woff2?v=3)
+BLOCK_GROUPS = {
+    "trackers": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*facebook.net*", "*connect.facebook.com*", "*scorecardresearch.com*", "*quantserve.com*",
+        "*amazon-adsystem.com*", "*adnxs.com*", "*branch.io*", "*sentry.io*",
+    ],
+    "fonts": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"],
+    # Off by default: the uploaded-image thumbnail in the editor comes from the same CDN
+    "images": ["*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.svg*"],
+}
+DEFAULT_POLICY = {"trackers": True, "fonts": True, "media": True, "images": False, "extra": []}
+
+TRANSFER_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    resources: resources.length,
+    bytes: resources.reduce((total, r) => total + (r.transferSize || 0), nav ? nav.transferSize || 0 : 0)
+};
+"""
+
+
+def blocked_urls(policy=None):
+    policy = policy or DEFAULT_POLICY
+    urls = []
+    for group, patterns in BLOCK_GROUPS.items():
+        if policy.get(group, DEFAULT_POLICY.get(group)):
+            urls.extend(patterns)
+    urls.extend(policy.get("extra", []))
+    return urls
+
+
+def apply_policy(driver, policy=None):
+    """Block the policy's URL patterns for every request this driver makes, via DevTools network interception."""
+    urls = blocked_urls(policy)
+    if not urls:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        logging.info(f"Blocking {len(urls)} URL patterns in the automation browser")
+    except Exception as e:
+        logging.warning(f"Could not apply request blocking: {e}")
+
+
+def navigate(driver, url):
+    """driver.get(url) until the DOM is usable, logging load time and what was actually transferred."""
+    started = time.monotonic()
+    driver.get(url)
+    wait_for(driver, "page_ready", page_ready)
+    elapsed = time.monotonic() - started
+    try:
+        stats = driver.execute_script(TRANSFER_SCRIPT)
+        logging.info(f"Loaded {url} in {elapsed:.2f}s: {stats['resources']} resources, "
+                     f"{stats['bytes'] // 1024} KB transferred")
+    except Exception:
+        logging.info(f"Loaded {url} in {elapsed:.2f}s")
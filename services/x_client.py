@@ -0,0 +1,95 @@
+import threading
+import time
+import logging
+import requests
+import tweepy
+
+MEDIA_REUSE_SECONDS = 12 * 3600  # X media ids stay attachable for 24h; reuse well inside that
+MAX_RATE_LIMIT_RETRIES = 3
+TWEETS_ENDPOINT = "tweets"
+MEDIA_ENDPOINT = "media"
+
+_lock = threading.Lock()
+_clients = {}
+
+
+def get_clients(api_key, api_secret, access_token, access_secret):
+    """(tweepy.Client, tweepy.API) for a credential set, authenticated once and shared by every poster."""
+    credentials = (api_key, api_secret, access_token, access_secret)
+    with _lock:
+        clients = _clients.get(credentials)
+        if clients is None:
+            # Raw responses keep the x-rate-limit-* headers the rate limiter feeds on
+            client = tweepy.Client(consumer_key=api_key, consumer_secret=api_secret,
+                                   access_token=access_token, access_token_secret=access_secret,
+                                   return_type=requests.Response)
+            auth = tweepy.OAuthHandler(api_key, api_secret)
+            auth.set_access_token(access_token, access_secret)
+            clients = _clients[credentials] = (client, tweepy.API(auth))
+        return clients
+
+
+def rate_limited(limiter, endpoint, call, headers_of, on_wait=None):
+    """Run call() under the endpoint's token bucket; a 429 waits for the next window instead of failing."""
+    if limiter is None:
+        return call()
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire(endpoint, on_wait)
+        try:
+            result = call()
+        except tweepy.TooManyRequests as e:
+            limiter.exhausted(endpoint, e.response.headers if e.response is not None else None)
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            logging.warning(f"X returned 429 for {endpoint}; re-queued for the next window")
+            continue
+        limiter.update(endpoint, headers_of(result))
+        return result
+
+
+def tweet_text(content):
+    return f"{content['title']} {content['link']}"[:280]
+
+
+def media_key(content, image):
+    # Preprocessing gives every near-duplicate its group's hash, so a whole group goes up to X once
+    return content.get("image_hash") or image
+
+
+class MediaCache:
+    """Media ids of recent uploads, keyed by image hash (or path), reused while X still accepts them."""
+
+    def __init__(self, max_age=MEDIA_REUSE_SECONDS):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._media = {}
+
+    def get(self, key):
+        with self._lock:
+            cached = self._media.get(key)
+        if cached and time.time() - cached[1] < self.max_age:
+            return cached[0]
+        return None
+
+    def upload(self, api, key, image, limiter=None, on_wait=None):
+        media_id = self.get(key)
+        if media_id is not None:
+            logging.info(f"Reusing uploaded media {media_id} for {image}")
+            return media_id
+        media = rate_limited(limiter, MEDIA_ENDPOINT, lambda: api.media_upload(image),
+                             lambda _: api.last_response.headers if api.last_response is not None else None,
+                             on_wait)
+        with self._lock:
+            self._media[key] = (media.media_id, time.time())
+        return media.media_id
+
+
+def post_tweet(clients, media_cache, content, image, limiter=None, on_wait=None):
+    """Upload the image (if any) and create the tweet; raises on failure."""
+    client, api = clients
+    media_ids = None
+    if image:
+        media_ids = [media_cache.upload(api, media_key(content, image), image, limiter, on_wait)]
+    rate_limited(limiter, TWEETS_ENDPOINT, lambda: client.create_tweet(text=tweet_text(content), media_ids=media_ids),
+                 lambda response: response.headers, on_wait)
+    logging.info(f"Posted to Twitter: {content['title']}")
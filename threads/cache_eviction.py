@@ -0,0 +1,30 @@
+from PySide6.QtCore import QThread, Signal
+import time
+import logging
+
+class CacheEvictionThread(QThread):
+    evicted = Signal(list)  # IDs of the evicted articles
+
+    def __init__(self, parent, cache_manager, interval_minutes, protected_ids, paused=None):
+        super().__init__(parent)
+        self.cache_manager = cache_manager
+        self.interval_seconds = interval_minutes * 60
+        self.protected_ids = protected_ids
+        self.paused = paused  # e.g. a fetch holding article rows it may still write back
+        self.running = True
+
+    def run(self):
+        next_run = time.time()
+        while self.running:
+            if time.time() >= next_run and not (self.paused and self.paused()):
+                try:
+                    evicted = self.cache_manager.evict(self.protected_ids())
+                    if evicted:
+                        self.evicted.emit(evicted)
+                except Exception as e:
+                    logging.error(f"Cache eviction failed: {e}")
+                next_run = time.time() + self.interval_seconds
+            time.sleep(0.5)
+
+    def stop(self):
+        self.running = False
\ No newline at end of file
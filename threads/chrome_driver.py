@@ -1,8 +1,6 @@
 from PySide6.QtCore import QThread, Signal
-from PySide6.QtWidgets import QApplication
-import undetected_chromedriver as uc
-import time
 import logging
+import threading
 
 class ChromeDriverThread(QThread):
     status = Signal(str)
@@ -10,45 +8,43 @@ class ChromeDriverThread(QThread):
     finished = Signal()
     error = Signal(str)
     post_status = Signal(int, bool)
+    group_status = Signal(int, str, bool)
 
-    def __init__(self, parent, news_items, quora_groups, template):
+    def __init__(self, parent, news_items, quora_groups, template, driver_pool, ready=None):
         super().__init__(parent)
         self.news_items = news_items
         self.quora_groups = quora_groups
         self.template = template
-        self.driver = None
+        self.driver_pool = driver_pool
+        self.ready = ready  # per-article threading.Event set once its image is processed
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop before the next article (e.g. image preprocessing failed); wakes a thread waiting on an image."""
+        self.cancelled.set()
+        for event in self.ready or []:
+            event.set()
 
     def run(self):
         try:
-            self.status.emit("Initializing ChromeDriver...")
-            options = uc.ChromeOptions()
-            options.add_argument("--start-maximized")
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            
-            self.driver = uc.Chrome(options=options)
-            self.driver.set_page_load_timeout(300)  # Increase to 5 minutes (300 seconds)
-            self.driver.implicitly_wait(30)  # Implicit wait of 30 seconds for element lookups
-            self.status.emit("ChromeDriver initialized, navigating to Quora...")
-            self.driver.get("https://www.quora.com/")
-            time.sleep(5)
-            
-            self.status.emit("Logging into Quora...")
-            self.parent().dologin(self.driver)
-            
+            self.driver_pool.warm()  # top up idle slots so every group can fan out
             total_posts = len(self.news_items)
             for i, news in enumerate(self.news_items):
+                if self.ready and not self.ready[i].is_set():
+                    self.status.emit(f"Waiting for image {i + 1}/{total_posts}...")
+                    self.ready[i].wait()
+                if self.cancelled.is_set():
+                    logging.warning(f"Quora posting cancelled after {i}/{total_posts} articles")
+                    return
                 self.status.emit(f"Posting to Quora: {i + 1}/{total_posts}")
-                try:
-                    self.parent().post_toquora(self.driver, news, self.quora_groups, self.template)
-                    self.post_status.emit(i, True)
-                except Exception as e:
-                    logging.error(f"Quora posting failed for {news['title']}: {e}")
-                    self.post_status.emit(i, False)
+                results = self.parent().post_toquora(news, self.quora_groups, self.template)
+                for group_url, error in results.items():
+                    self.group_status.emit(i, group_url, error is None)
+                failed = sum(1 for error in results.values() if error is not None)
+                if failed:
+                    logging.error(f"Quora posting failed for {news['title']} in {failed}/{len(results)} groups")
+                self.post_status.emit(i, not failed)
                 self.progress.emit((i + 1) * 100 // total_posts)
-                QApplication.processEvents()
             
             self.status.emit("Quora posting complete")
             self.finished.emit()
@@ -58,11 +54,3 @@ class ChromeDriverThread(QThread):
             logging.error(error_msg)
             self.error.emit(error_msg)
             self.status.emit("Error during Quora posting")
-        
-        finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.status.emit("ChromeDriver closed")
-                except Exception as e:
-                    logging.error(f"Failed to close ChromeDriver: {e}")
\ No newline at end of file
@@ -1,60 +1,147 @@
 from PySide6.QtCore import QThread, Signal
 import feedparser
-import requests
-from bs4 import BeautifulSoup
-import concurrent.futures
-import json
-import os
+import asyncio
 import logging
+from services.http_cache import HttpCache
+from services.article_store import ArticleStore, ensure_article_id
+from services.article import Article, STORY_UNAVAILABLE, STORY_ERROR_PREFIX
+from services.fetch_engine import AsyncFetchEngine
+from services.http_session import get_session, format_pool_stats
+from services.extractor import extract_story
+
+DEFAULT_FEEDS = ["https://nypost.com/politics/feed/"]
+
+def entry_key(entry):
+    return entry.get("id") or entry.link
 
 class FetchNewsThread(QThread):
     progress = Signal(int)
     finished = Signal(list)
+    fetch_stats = Signal(int, int, int, int)  # new, re-scraped, unchanged, gone
+    article_ready = Signal(object)
 
-    def __init__(self, parent=None, use_cache=False):
+    def __init__(self, parent=None, use_cache=False, incremental=False, feeds=None, max_connections=16, max_per_host=4, streaming=False, store=None):
         super().__init__(parent)
+        self.store = store or ArticleStore()
         self.use_cache = use_cache
+        self.incremental = incremental
+        self.streaming = streaming
+        self.feeds = feeds or DEFAULT_FEEDS
+        self.http_cache = HttpCache()
+        self.engine = AsyncFetchEngine(max_connections=max_connections, max_per_host=max_per_host)
 
     def run(self):
-        cache_file = "news_cache.json"
-        if self.use_cache and os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                news_data = json.load(f)
+        if self.use_cache and self.store.has_articles():
+            news_data = self.store.all()
             self.progress.emit(100)
             self.finished.emit(news_data)
             return
 
-        RSS_FEED_URL = "https://nypost.com/politics/feed/"
-        feed = feedparser.parse(RSS_FEED_URL)
+        scraped, news_data = self.engine.run(self.fetch_all)
+
+        self.http_cache.save()
+        logging.info(format_pool_stats())
+        # Unchanged articles are already stored as they are; only new and re-scraped rows are written
+        self.store.add_all(scraped)
+
+        self.finished.emit(news_data)
+
+    async def fetch_all(self):
+        feeds = await asyncio.gather(*[self.engine.call(url, self.fetch_feed, url) for url in self.feeds])
+
+        entries = []
+        seen = set()
+        for feed_url, feed in zip(self.feeds, feeds):
+            for entry in feed.entries:
+                key = entry_key(entry)
+                if key in seen:
+                    continue
+                seen.add(key)
+                entries.append((feed_url, entry))
+
+        # Indexed guid/link lookups for this feed's entries only, never a scan of the whole store
+        existing = {}
+        stored_count = 0
+        if self.incremental:
+            stored_count = self.store.count()
+            existing = self.store.lookup([key for _, entry in entries for key in (entry_key(entry), entry.link)])
+
         news_data = []
-        total_entries = len(feed.entries)
+        new_entries = []
+        matched = set()
+        for feed_url, entry in entries:
+            cached, story_failed = existing.get(entry_key(entry)) or existing.get(entry.link) or (None, False)
+            if cached is None:
+                new_entries.append((feed_url, entry, None))
+                continue
+            if cached["id"] in matched:
+                continue
+            matched.add(cached["id"])
+            if story_failed:
+                # A previous scrape failed: fetch the story again but keep the stored row otherwise
+                new_entries.append((feed_url, entry, cached))
+            else:
+                news_data.append(cached)
+                self.emit_article(cached)
+        unchanged_count = len(news_data)
+        gone_count = stored_count - len(matched)
+        total_entries = len(new_entries)
+        rescraped_count = sum(1 for _, _, cached in new_entries if cached is not None)
 
-        def fetch_story(entry):
+        def fetch_story(feed_url, entry, cached):
+            full_story = self.scrape_full_story(entry.link)
+            if cached is not None:
+                # Processed image fields stay as they are; only the failed story is replaced
+                cached.fullstory = full_story
+                return cached
             title = entry.title
             link = entry.link
             summary = entry.summary if hasattr(entry, "summary") else "No summary available."
             image = entry.media_content[0]['url'] if hasattr(entry, "media_content") else None
-            full_story = self.scrape_full_story(link)
-            return {"title": title, "summary": summary, "fullstory": full_story, "link": link, "image": image}
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = [executor.submit(fetch_story, entry) for entry in feed.entries]
-            for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                news_data.append(future.result())
-                self.progress.emit((i + 1) * 100 // total_entries)
-
-        with open(cache_file, 'w') as f:
-            json.dump(news_data, f)
-        
-        self.finished.emit(news_data)
+            news = Article(guid=entry_key(entry), feed=feed_url, title=title, summary=summary, fullstory=full_story, link=link, image=image, source_image=image)
+            ensure_article_id(news)
+            return news
+
+        async def fetch_indexed(index, feed_url, entry, cached):
+            return index, await self.engine.call(entry.link, fetch_story, feed_url, entry, cached)
+
+        tasks = [fetch_indexed(index, feed_url, entry, cached) for index, (feed_url, entry, cached) in enumerate(new_entries)]
+        scraped = [None] * total_entries  # feed order, so the store lists new articles the way the feed does
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            index, news = await task
+            scraped[index] = news
+            news_data.append(news)
+            self.emit_article(news)
+            self.progress.emit((i + 1) * 100 // total_entries)
+
+        new_count = total_entries - rescraped_count
+        logging.info(f"Fetched {len(self.feeds)} feed(s): {new_count} new, {rescraped_count} re-scraped, "
+                     f"{unchanged_count} unchanged, {gone_count} gone")
+        self.fetch_stats.emit(new_count, rescraped_count, unchanged_count, gone_count)
+        self.progress.emit(100)
+        return scraped, news_data
+
+    def emit_article(self, news):
+        if self.streaming:
+            self.article_ready.emit(news)
+
+    def fetch_feed(self, url):
+        try:
+            feed_text, not_modified = self.http_cache.fetch(url, timeout=self.engine.timeout)
+            if not_modified:
+                logging.info(f"Feed not modified since last fetch: {url}")
+        except Exception as e:
+            logging.error(f"Failed to fetch feed {url}: {e}")
+            feed_text = ""
+        return feedparser.parse(feed_text)
 
     def scrape_full_story(self, url):
         try:
-            response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=300)
-            soup = BeautifulSoup(response.text, "html.parser")
-            paragraphs = soup.find_all("p")
-            full_story = "\n".join([p.get_text() for p in paragraphs if len(p.get_text()) > 50])
-            return full_story if full_story else "Full story not available."
+            # Known articles are never re-scraped (their story lives in the store), so pages skip the HTTP cache
+            response = get_session().get(url, timeout=self.engine.timeout)
+            response.raise_for_status()
+            full_story = extract_story(response.text, url)
+            return full_story if full_story else STORY_UNAVAILABLE
         except Exception as e:
             logging.error(f"Failed to scrape {url}: {e}")
-            return f"❌ Error fetching story: {e}"
\ No newline at end of file
+            return f"{STORY_ERROR_PREFIX} {e}"
\ No newline at end of file
@@ -1,55 +1,107 @@
 from PySide6.QtCore import QThread, Signal
-from PySide6.QtWidgets import QApplication
 import os
-import json
 import logging
+from services.image_cache import ImageCache
+from services.image_pipeline import MAX_SIZE
+from services.phash import find_match
 
 class ImagePreprocessingThread(QThread):
     progress = Signal(int)
+    item_ready = Signal(int)  # queue index whose images are final
     finished = Signal()
     error = Signal(str)
 
-    def __init__(self, parent, selected_news, logo_url, output_dir):
+    def __init__(self, parent, selected_news, logo_url, output_dir, pipeline, profiles, margin=20):
         super().__init__(parent)
         self.selected_news = selected_news
         self.logo_url = logo_url
         self.output_dir = output_dir
+        self.pipeline = pipeline
+        self.profiles = profiles
+        self.margin = margin
         self.news_poster_app = parent
+        self.pending = {}
+
+    def apply_variants(self, news, variants):
+        news["image_variants"] = variants
+        # "image" keeps pointing at the first profile for previews and older callers
+        news["image"] = next(iter(variants.values()))
+
+    def apply_result(self, source, variants):
+        for index, news in self.pending[source]:
+            if variants:
+                self.apply_variants(news, variants)
+            else:
+                logging.warning(f"Failed to process image for {news['title']}")
+                news["image"] = self.logo_url
+                news["image_variants"] = None
+            self.item_ready.emit(index)
+
+    def share_group_hashes(self):
+        # Near-duplicates differ by a few bits; give each the first group member's hash so X uploads it once
+        representatives = []
+        for news in self.selected_news:
+            image_hash = news.get("image_hash")
+            if not image_hash:
+                continue
+            match = find_match(image_hash, representatives)
+            if match is None:
+                representatives.append((image_hash, image_hash))
+            else:
+                news["image_hash"] = match
 
     def run(self):
         try:
-            total_items = len(self.selected_news)
             if not os.path.exists(self.output_dir):
                 os.makedirs(self.output_dir)
 
-            for i, news in enumerate(self.selected_news):
-                if news.get("image"):
-                    image_filename = f"article_{i}.png"
-                    local_image_path = os.path.join(self.output_dir, image_filename)
-                    
-                    output_image = self.news_poster_app.add_logo(news["image"], self.logo_url)
-                    if output_image:
-                        output_image.save(local_image_path)
-                        news["image"] = local_image_path
-                    else:
-                        logging.warning(f"Failed to process image for {news['title']}")
-                        news["image"] = self.logo_url
-                
-                self.progress.emit((i + 1) * 100 // total_items)
-                QApplication.processEvents()
-
-            cache_file = "news_cache.json"
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    full_news_data = json.load(f)
-                for i, news in enumerate(self.selected_news):
-                    idx = self.news_poster_app.selected_news_indices[i]
-                    full_news_data[idx]["image"] = news["image"]
-                with open(cache_file, 'w') as f:
-                    json.dump(full_news_data, f)
+            image_cache = ImageCache(self.output_dir)
+            output_dir = os.path.abspath(self.output_dir)
+            self.pending = {}  # source -> (queue index, article) waiting on it
+            jobs = []
+            hits = 0
+            for index, news in enumerate(self.selected_news):
+                source = news.get("source_image")
+                if not source:
+                    image = news.get("image")
+                    # Older articles only kept the processed path; never stamp the logo twice
+                    if not image or os.path.dirname(os.path.abspath(image)) == output_dir:
+                        self.item_ready.emit(index)
+                        continue
+                    source = news["source_image"] = image
+                outputs, hit = image_cache.lookup(source, self.logo_url, MAX_SIZE, self.margin, self.profiles)
+                if hit:
+                    self.apply_variants(news, {name: path for name, (path, _) in outputs.items()})
+                    self.item_ready.emit(index)
+                    hits += 1
+                    continue
+                if source not in self.pending:
+                    self.pending[source] = []
+                    jobs.append((source, outputs))
+                self.pending[source].append((index, news))
+
+            logging.info(f"Image cache: {hits} hits, {len(jobs)} images to process")
+            results, hashes, duplicate_of = self.pipeline.run(
+                jobs, self.logo_url, margin=self.margin,
+                progress=lambda done, total: self.progress.emit(done * 100 // total),
+                on_result=lambda i, variants: self.apply_result(jobs[i][0], variants))
+            duplicates = sum(1 for original in duplicate_of if original is not None)
+            if duplicates:
+                logging.info(f"Reused {duplicates} processed image(s) for near-identical source photos")
+
+            for (source, outputs), image_hash in zip(jobs, hashes):
+                for index, news in self.pending[source]:
+                    news["image_hash"] = image_hash
+            self.share_group_hashes()
+            self.progress.emit(100)
+
+            store = self.news_poster_app.article_store
+            for news in self.selected_news:
+                store.update_image(news["id"], news["image"], news.get("source_image"), news.get("image_variants"),
+                                   news.get("image_hash"))
 
             self.finished.emit()
         except Exception as e:
             error_msg = f"Image preprocessing failed: {str(e)}"
             logging.error(error_msg)
-            self.error.emit(error_msg)
\ No newline at end of file
+            self.error.emit(error_msg)
@@ -1,6 +1,5 @@
 from PySide6.QtCore import QThread, Signal
 import schedule
-import undetected_chromedriver as uc
 from datetime import datetime
 import time
 import logging
@@ -13,7 +12,8 @@ class SchedulerThread(QThread):
     error = Signal(str)
     post_status = Signal(int, bool)
 
-    def __init__(self, parent, start_time, interval, news_items, quora_groups, template, post_to_x, post_to_quora):
+    def __init__(self, parent, start_time, interval, news_items, quora_groups, template, post_to_x, post_to_quora,
+                 driver_pool):
         super().__init__(parent)
         self.start_time = start_time
         self.interval = interval
@@ -22,7 +22,7 @@ class SchedulerThread(QThread):
         self.template = template
         self.post_to_x = post_to_x
         self.post_to_quora = post_to_quora
-        self.driver = None
+        self.driver_pool = driver_pool  # warmed up front; post_toquora borrows from it
         self.current_index = 0
 
     def post_next_item(self):
@@ -33,17 +33,18 @@ class SchedulerThread(QThread):
         success = True
         try:
             if self.post_to_x:
-                self.parent().post_to_twitter(news, self.current_index)
+                self.parent().post_to_twitter(news)
         except Exception as e:
             logging.error(f"Twitter posting failed for {news['title']}: {e}")
             success = False
 
-        try:
-            if self.post_to_quora:
-                self.parent().post_toquora(self.driver, news, self.quora_groups, self.template)
-        except Exception as e:
-            logging.error(f"Quora posting failed for {news['title']}: {e}")
-            success = False
+        if self.post_to_quora:
+            # Groups fan out over pooled drivers; nothing is pinned between scheduled posts
+            results = self.parent().post_toquora(news, self.quora_groups, self.template)
+            failed = [group_url for group_url, error in results.items() if error is not None]
+            if failed:
+                logging.error(f"Quora posting failed for {news['title']} in {', '.join(failed)}")
+                success = False
 
         self.post_status.emit(self.current_index, success)
         self.current_index += 1
@@ -56,13 +57,8 @@ class SchedulerThread(QThread):
     def run(self):
         try:
             if self.post_to_quora:
-                self.status.emit("Initializing ChromeDriver for Quora...")
-                options = uc.ChromeOptions()
-                options.add_argument("--start-maximized")
-                self.driver = uc.Chrome(options=options)
-                self.driver.get("https://www.quora.com/")
-                time.sleep(10)
-                self.parent().dologin(self.driver)
+                self.status.emit("Warming ChromeDriver for Quora...")
+                self.driver_pool.warm(1)
 
             current_time = datetime.now()
             if self.start_time > current_time:
@@ -87,12 +83,4 @@ class SchedulerThread(QThread):
             error_msg = f"Scheduling failed: {str(e)}"
             logging.error(error_msg)
             self.error.emit(error_msg)
-            self.status.emit("Error during scheduling")
-
-        finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    self.status.emit("ChromeDriver closed")
-                except Exception as e:
-                    logging.error(f"Failed to close ChromeDriver: {e}")
\ No newline at end of file
+            self.status.emit("Error during scheduling")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from PySide6.QtCore import QThread, Signal
-import requests
+from services.http_session import get_session
 
 class WebpageFetchThread(QThread):
     webpage_fetched = Signal(str, str)
@@ -11,7 +11,7 @@ class WebpageFetchThread(QThread):
 
     def run(self):
         try:
-            response = requests.get(self.url, timeout=10)
+            response = get_session().get(self.url, timeout=10)
             response.raise_for_status()
             self.webpage_fetched.emit(self.url, response.text)
         except Exception as e:
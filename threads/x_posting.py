@@ -0,0 +1,75 @@
+from PySide6.QtCore import QThread, Signal
+import concurrent.futures
+import logging
+from datetime import datetime
+from services.x_client import get_clients, media_key, post_tweet, TWEETS_ENDPOINT, MEDIA_ENDPOINT
+
+class XPostingThread(QThread):
+    status = Signal(str)
+    progress = Signal(int)
+    finished = Signal()
+    error = Signal(str)
+    post_status = Signal(int, bool)
+
+    def __init__(self, parent, news_items, credentials, media_cache, images, rate_limiter=None, upload_workers=4):
+        super().__init__(parent)
+        self.news_items = news_items
+        self.credentials = credentials
+        self.media_cache = media_cache
+        self.images = images  # queue index -> processed image path for X (or None)
+        self.rate_limiter = rate_limiter
+        self.upload_workers = upload_workers
+
+    def on_rate_limited(self, endpoint, resume_at):
+        self.status.emit(f"X rate limit reached ({endpoint}); resuming at {datetime.fromtimestamp(resume_at).strftime('%I:%M:%S %p')}")
+
+    def projected_completion(self, tweets_left, uploads_left):
+        if self.rate_limiter is None:
+            return ""
+        finish = self.rate_limiter.projected_finish({TWEETS_ENDPOINT: tweets_left, MEDIA_ENDPOINT: uploads_left})
+        return f" (projected completion {datetime.fromtimestamp(finish).strftime('%I:%M %p')})"
+
+    def run(self):
+        try:
+            clients = get_clients(*self.credentials)
+            _, api = clients
+            queue = []
+            posted_ids = set()
+            for i, news in enumerate(self.news_items):
+                if news['id'] not in posted_ids:
+                    posted_ids.add(news['id'])
+                    queue.append((i, news))
+
+            total_posts = len(queue)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.upload_workers) as upload_pool:
+                # Start every upload up front; tweets then go out in queue order as their media lands
+                uploads = {}
+                for i, news in queue:
+                    image = self.images.get(i)
+                    key = image and media_key(news, image)
+                    if key and key not in uploads:
+                        uploads[key] = upload_pool.submit(self.media_cache.upload, api, key, image,
+                                                          self.rate_limiter, self.on_rate_limited)
+
+                for posted, (i, news) in enumerate(queue, start=1):
+                    uploads_left = sum(1 for future in uploads.values() if not future.done())
+                    eta = self.projected_completion(total_posts - posted + 1, uploads_left)
+                    self.status.emit(f"Posting to X: {posted}/{total_posts}{eta}")
+                    image = self.images.get(i)
+                    try:
+                        if image:
+                            uploads[media_key(news, image)].result()
+                        post_tweet(clients, self.media_cache, news, image, self.rate_limiter, self.on_rate_limited)
+                        self.post_status.emit(i, True)
+                    except Exception as e:
+                        logging.error(f"Twitter posting failed for {news['title']}: {e}")
+                        self.post_status.emit(i, False)
+                    self.progress.emit(posted * 100 // total_posts)
+
+            self.status.emit("X posting complete")
+            self.finished.emit()
+        except Exception as e:
+            error_msg = f"X posting thread failed: {str(e)}"
+            logging.error(error_msg)
+            self.error.emit(error_msg)
+            self.status.emit("Error during X posting")